@@ -10,8 +10,11 @@ import argparse
 import getpass
 import json
 from pathlib import Path
+import shlex
+import shutil
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 import traceback
@@ -28,17 +31,26 @@ REMOTE_VENV_DIR = ".venv"  # Virtual environment folder
 CONFIG_FILE_NAME = "connect_config.json"  # Local saved setup metadata
 SSH_KEY_FILE = "id_rsa"  # Default SSH key file
 SSH_CONNECT_TIMEOUT = 30
-SSH_OPTS = "-o StrictHostKeyChecking=no"
+SSH_OPTS = ["-o", "StrictHostKeyChecking=no"]
+SSH_CONTROL_PERSIST = 600  # Seconds the shared SSH connection stays open after the last command
 APT_PACKAGES = (
     "python3 python3-pip python3-venv python3-dev build-essential pkg-config "
     "i2c-tools python3-smbus python3-smbus2 python3-rpi.gpio "
     "python3-numpy python3-scipy libatlas-base-dev python3-rpi.gpio"
 )
+APT_UPDATE_MAX_AGE = 24 * 60 * 60  # Seconds an earlier system update counts as fresh on a re-run
 ENABLE_I2C_CMDS = [
     "sudo raspi-config nonint do_i2c 0",
     "sudo grep -q 'dtparam=i2c_arm=on' /boot/firmware/config.txt "
     "|| echo 'dtparam=i2c_arm=on' | sudo tee -a /boot/firmware/config.txt",
 ]
+# Marks the deployed shell scripts executable
+FINALIZE_CMD = f"cd ~/{PROJECT_DIR} && find . -name '*.sh' -exec chmod +x {{}} \\;"
+# Bakes the config app menus into spot_config/menus_baked.py, with the import path spot_config.sh uses
+BAKE_MENUS_CMD = (
+    f"cd ~/{PROJECT_DIR} && PYTHONPATH=~/{PROJECT_DIR}:~ "
+    f"~/{REMOTE_VENV_DIR}/bin/python3 -m spotmicroai.spot_config.bake_menus"
+)
 RSYNC_EXCLUDES = [
     "*.pyc",
     "*/__pycache__/",
@@ -52,6 +64,9 @@ RSYNC_EXCLUDES = [
     ".pytest_cache/",
     ".mypy_cache/",
     "spotmicroai.json",
+    # Menu caches generated on the Pi, which --delete would otherwise remove on every sync
+    "spot_config/menus_baked.py",
+    "spot_config/menus/.cache/",
 ]
 TOTAL_STEPS = 9
 VERSION = "SpotmicroAI Setup Tool"
@@ -75,11 +90,18 @@ class Colors:
     NC = '\033[0m'
 
 
-if not USE_COLORS:
+# Escape codes would end up verbatim in redirected output, so colors need a terminal
+if not USE_COLORS or not sys.stdout.isatty():
     for attr in vars(Colors):
         if not attr.startswith("__"):
             setattr(Colors, attr, "")
 
+# Colored message prefixes, built once
+INFO_LINE_PREFIX = f"{Colors.GREEN}{LABELS.INFO_PREFIX}{Colors.NC} "
+WARN_LINE_PREFIX = f"{Colors.YELLOW}{LABELS.WARN_PREFIX}{Colors.NC} "
+ERROR_LINE_PREFIX = f"{Colors.RED}{LABELS.ERROR_PREFIX}{Colors.NC} "
+INPUT_LINE_PREFIX = f"{Colors.MAGENTA}[INPUT]{Colors.NC} "
+
 
 # ------------------------------------------------------------------
 # Setup Tool
@@ -92,8 +114,18 @@ class SetupTool:
         self.script_dir = Path(__file__).parent
         self.config_file = self.script_dir / CONFIG_FILE_NAME
         self.config = {}
+        # Set when self.config changes; the file is written once at the end of run()
+        self._config_dirty = False
         self.args = args or argparse.Namespace()
         self.current_password = None
+        # Directory holding the SSH ControlMaster socket, None while no shared connection is open
+        self._control_dir = None
+        # SSH options and host, built on first use and reset whenever the config or master changes
+        self._ssh_argv = None
+        # rsync upload started ahead of the copy step so it overlaps the package installs
+        self._upload = None
+        # Local SSH key pair used for passwordless login
+        self.ssh_key_file = Path.home() / ".ssh" / SSH_KEY_FILE
         # Setup logging
         self.log_file = self.script_dir / "setup.log"
         self.log_handle = None
@@ -103,15 +135,15 @@ class SetupTool:
     # ------------------------------------------------------------------
     def print_info(self, msg):
         """Print an informational message in green."""
-        print(f"{Colors.GREEN}{LABELS.INFO_PREFIX}{Colors.NC} {msg}")
+        print(INFO_LINE_PREFIX + msg)
 
     def print_warn(self, msg):
         """Print a warning message in yellow."""
-        print(f"{Colors.YELLOW}{LABELS.WARN_PREFIX}{Colors.NC} {msg}")
+        print(WARN_LINE_PREFIX + msg)
 
     def print_err(self, msg):
         """Print an error message in red."""
-        print(f"{Colors.RED}{LABELS.ERROR_PREFIX}{Colors.NC} {msg}")
+        print(ERROR_LINE_PREFIX + msg)
 
     def print_step(self, n, msg):
         """Print a step message with step number in blue."""
@@ -120,7 +152,7 @@ class SetupTool:
 
     def print_input(self, msg):
         """Print an input prompt in magenta."""
-        print(f"{Colors.MAGENTA}[INPUT]{Colors.NC} {msg}", end=" ", flush=True)
+        print(INPUT_LINE_PREFIX + msg, end=" ", flush=True)
 
     def _log(self, msg):
         """Write message to log file."""
@@ -199,16 +231,25 @@ class SetupTool:
             try:
                 with open(self.config_file, "r", encoding="utf-8") as f:
                     self.config = json.load(f)
+                self._ssh_argv = None
                 return True
             except Exception as e:
                 self.print_warn(LABELS.ERR_INVALID_CONFIG.format(e=e))
         return False
 
     def save_config(self):
-        """Save current configuration to the config file."""
+        """Mark the configuration as changed; flush_config() writes it once when the run ends."""
+        self._config_dirty = True
+        return True
+
+    def flush_config(self):
+        """Write the configuration to the config file if it changed during this run."""
+        if not self._config_dirty:
+            return True
         try:
             with open(self.config_file, "w", encoding="utf-8") as f:
                 json.dump(self.config, f, indent=2)
+            self._config_dirty = False
             self.print_info(LABELS.MSG_CONFIG_SAVED.format(config_file=self.config_file))
             return True
         except Exception as e:
@@ -218,25 +259,84 @@ class SetupTool:
     # ------------------------------------------------------------------
     # SSH helpers
     # ------------------------------------------------------------------
-    def _ssh_prefix(self):
-        """Generate SSH command prefix with authentication."""
+    def _control_opts(self):
+        """Generate the SSH options that route a connection through the shared master, if open."""
+        return ["-o", f"ControlPath={self._control_dir}/%C"] if self._control_dir else []
+
+    def _build_ssh_argv(self):
+        """Assemble the SSH options and host shared by every remote command."""
         host = f"{self.config['username']}@{self.config['hostname']}"
         key = self.config.get("ssh_key_path")
-        base = f"ssh -o ConnectTimeout={SSH_CONNECT_TIMEOUT} {SSH_OPTS}"
-        return f'{base} -i "{key}" {host}' if key else f"{base} {host}"
+        argv = ["-o", f"ConnectTimeout={SSH_CONNECT_TIMEOUT}", *SSH_OPTS, *self._control_opts()]
+        if key:
+            argv += ["-i", key]
+        self._ssh_argv = argv + [host]
+
+    def _ssh_prefix(self, *flags):
+        """Generate the SSH argument list, with authentication, up to and including the host."""
+        if self._ssh_argv is None:
+            self._build_ssh_argv()
+        return ["ssh", *flags, *self._ssh_argv]
+
+    def _open_master(self, batch_mode=False):
+        """Open one shared SSH connection that later ssh and rsync calls reuse.
+
+        Every command then runs as a new channel on the existing session instead of
+        paying a full TCP handshake and authentication. If the master cannot be opened
+        the tool falls back to one connection per command. With batch_mode set, password
+        prompts are disabled, so the master only opens if key authentication succeeds.
+        """
+        if self._control_dir:
+            return True
+        self._control_dir = tempfile.mkdtemp(prefix="spotmicroai-ssh-")
+        self._ssh_argv = None
+        flags = ["-M", "-N", "-f", "-o", f"ControlPersist={SSH_CONTROL_PERSIST}"]
+        if batch_mode:
+            flags += ["-o", "BatchMode=yes"]
+        argv = self._ssh_prefix(*flags)
+        # The backgrounded master keeps its inherited descriptors, so it must not hold a pipe open
+        result = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        if result.returncode == 0:
+            return True
+        self._log(f"[SSH MASTER] Could not open shared connection (exit code {result.returncode})")
+        shutil.rmtree(self._control_dir, ignore_errors=True)
+        self._control_dir = None
+        self._ssh_argv = None
+        return False
+
+    def _close_master(self):
+        """Close the shared SSH connection and remove its socket directory."""
+        if not self._control_dir:
+            return
+        host = f"{self.config['username']}@{self.config['hostname']}"
+        subprocess.run(
+            ["ssh", "-O", "exit", *self._control_opts(), host],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        shutil.rmtree(self._control_dir, ignore_errors=True)
+        self._control_dir = None
+        self._ssh_argv = None
 
     def _scp_prefix(self):
-        """Generate SCP command prefix with authentication."""
+        """Generate the SCP argument list with authentication."""
         key = self.config.get("ssh_key_path")
-        return f'scp -i "{key}" {SSH_OPTS}' if key else f"scp {SSH_OPTS}"
+        return ["scp", "-i", key, *SSH_OPTS] if key else ["scp", *SSH_OPTS]
 
-    def _run_remote(self, cmd, desc=None, capture=False):
-        """Execute a command on the remote Raspberry Pi."""
+    def _run_remote(self, cmd, desc=None, capture=False, stream=False):
+        """Execute a command on the remote Raspberry Pi.
+
+        With stream set, output is echoed and logged line by line as it arrives instead of
+        being buffered behind the spinner; use it for long commands such as apt and pip.
+        """
         if desc:
             self.print_info(desc)
-        full = f'{self._ssh_prefix()} "{cmd}"'
+        argv = self._ssh_prefix() + [cmd]
         try:
-            process = subprocess.Popen(full, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            if stream:
+                return self._stream_remote(argv)
+            process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
             spinner_thread = threading.Thread(target=self.show_spinner, args=(process,), daemon=True)
             spinner_thread.start()
             stdout, stderr = process.communicate()
@@ -258,6 +358,30 @@ class SetupTool:
             self._log(f"[ERROR] {LABELS.ERR_SSH_COMMAND_FAILED.format(e=e)}")
             return None if capture else False
 
+    def _stream_remote(self, argv):
+        """Run an SSH command, copying its combined output to the console and log as it arrives."""
+        process = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in process.stdout:
+            sys.stdout.write(line)
+            self._log(f"[STDOUT] {line.rstrip()}")
+        return process.wait() == 0
+
+    def _run_remote_script(self, cmds, desc=None, stream=False):
+        """Execute several commands on the remote Raspberry Pi in one SSH session.
+
+        The commands run as a single bash script that stops at the first failure. The script
+        is passed as an argument rather than on stdin, so a command that reads stdin, such
+        as an apt prompt, cannot swallow the commands after it.
+        """
+        script = "set -e\n" + "\n".join(cmds)
+        return self._run_remote(f"bash -c {shlex.quote(script)}", desc, stream=stream)
+
     # ------------------------------------------------------------------
     # User interaction
     # ------------------------------------------------------------------
@@ -302,6 +426,7 @@ class SetupTool:
             "password_provided": True,
             "setup_completed": False,
         }
+        self._ssh_argv = None
         self.current_password = password
         return self.save_config()
 
@@ -317,67 +442,87 @@ class SetupTool:
 
     def generate_ssh_keys(self):
         """Generate SSH key pair for authentication."""
-        ssh_dir = Path.home() / ".ssh"
-        ssh_dir.mkdir(exist_ok=True)
-        keyfile = ssh_dir / SSH_KEY_FILE
+        keyfile = self.ssh_key_file
         if keyfile.exists():
             return True
-        cmd = f'ssh-keygen -t rsa -b 4096 -f "{keyfile}" -N "" -q'
-        ok = subprocess.run(cmd, shell=True, check=False).returncode == 0
+        keyfile.parent.mkdir(exist_ok=True)
+        argv = ["ssh-keygen", "-t", "rsa", "-b", "4096", "-f", str(keyfile), "-N", "", "-q"]
+        ok = subprocess.run(argv, check=False).returncode == 0
         self.print_info(LABELS.MSG_SSH_KEY_GENERATED if ok else LABELS.ERR_SSH_KEY_GEN_FAILED)
         return ok
 
     def copy_ssh_key_to_pi(self):
         """Copy SSH public key to Raspberry Pi for passwordless authentication."""
-        pubkey = Path.home() / ".ssh" / f"{SSH_KEY_FILE}.pub"
-        if not pubkey.exists():
+        pubkey = self.ssh_key_file.with_name(f"{SSH_KEY_FILE}.pub")
+        try:
+            keydata = pubkey.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
             self.print_err(LABELS.ERR_PUBLIC_KEY_NOT_FOUND)
             return False
-        with open(pubkey, "r", encoding="utf-8") as f:
-            keydata = f.read().strip()
+        # Append the key only if it is not installed yet, so re-runs do not duplicate it
+        key_arg = shlex.quote(keydata)
         cmd = (
-            f'mkdir -p ~/.ssh && chmod 700 ~/.ssh && '
-            f'echo "{keydata}" >> ~/.ssh/authorized_keys && chmod 600 ~/.ssh/authorized_keys'
+            f'mkdir -p ~/.ssh && chmod 700 ~/.ssh && touch ~/.ssh/authorized_keys && '
+            f'(grep -qxF {key_arg} ~/.ssh/authorized_keys || echo {key_arg} >> ~/.ssh/authorized_keys) && '
+            f'chmod 600 ~/.ssh/authorized_keys'
         )
-        if self._run_remote(cmd, desc=LABELS.SUBSTEP_INSTALLING_SSH_KEY):
-            self.print_info(LABELS.MSG_SSH_KEY_INSTALLED)
-            self.config["ssh_key_path"] = str(Path.home() / ".ssh" / SSH_KEY_FILE)
-            self.current_password = None
-            self.save_config()
-            return True
-        return False
+        if not self._run_remote(cmd, desc=LABELS.SUBSTEP_INSTALLING_SSH_KEY):
+            return False
+        self.print_info(LABELS.MSG_SSH_KEY_INSTALLED)
+
+        # The current shared connection was authenticated with the password. Replace it
+        # with one that may only use the new key, so the rest of the setup proves the key works.
+        self._close_master()
+        self.config["ssh_key_path"] = str(self.ssh_key_file)
+        if not self._open_master(batch_mode=True):
+            self.config.pop("ssh_key_path")
+            self._ssh_argv = None
+            self.print_err(LABELS.ERR_SSH_KEY_REJECTED)
+            return False
+        self.current_password = None
+        self.save_config()
+        return True
 
     def perform_system_update(self):
         """Update system packages on the Raspberry Pi."""
         self.print_step(1, LABELS.STEP_SYSTEM_UPDATE)
-        cmds = [
-            ("sudo apt update", LABELS.SUBSTEP_UPDATING_PACKAGES),
-            ("sudo apt upgrade -y", LABELS.SUBSTEP_UPGRADING_PACKAGES),
-        ]
-        return all(self._run_remote(c, d) for c, d in cmds)
+        if time.time() - self.config.get("last_apt_update_epoch", 0) < APT_UPDATE_MAX_AGE:
+            self.print_info(LABELS.MSG_SYSTEM_UPDATE_FRESH)
+            return True
+        cmds = ["sudo apt update", "sudo apt upgrade -y"]
+        if not self._run_remote_script(cmds, LABELS.SUBSTEP_UPDATING_AND_UPGRADING, stream=True):
+            return False
+        self.config["last_apt_update_epoch"] = time.time()
+        self.save_config()
+        return True
 
     def enable_i2c(self):
         """Enable I2C interface on the Raspberry Pi."""
         self.print_step(2, LABELS.STEP_ENABLE_I2C)
-        return all(self._run_remote(c) for c in ENABLE_I2C_CMDS)
+        return self._run_remote_script(ENABLE_I2C_CMDS)
 
     def create_project_directory(self):
         """Create the project directory on the Raspberry Pi."""
         self.print_step(3, LABELS.STEP_CREATE_PROJECT_DIR)
         out = self._run_remote(f"test -d ~/{PROJECT_DIR} && echo EXISTS || echo NOT_EXISTS", capture=True)
+        cmds = []
         if out == "EXISTS":
             self.print_warn(LABELS.WARN_EXISTING_DIR_FOUND.format(project_dir=PROJECT_DIR))
-            if self.confirm(LABELS.PROMPT_REMOVE_DIR, True):
-                self._run_remote(f"rm -rf ~/{PROJECT_DIR}")
-            else:
+            if not self.confirm(LABELS.PROMPT_REMOVE_DIR, True):
                 self.print_err(LABELS.ERR_CANNOT_PROCEED_EXISTING_DIR)
                 return False
-        return self._run_remote(f"mkdir -p ~/{PROJECT_DIR} && cd ~/{PROJECT_DIR} && pwd")
+            cmds.append(f"rm -rf ~/{PROJECT_DIR}")
+        cmds.append(f"mkdir -p ~/{PROJECT_DIR} && cd ~/{PROJECT_DIR} && pwd")
+        if not self._run_remote_script(cmds):
+            return False
+        # Upload the project while the Pi installs packages; step 6 waits for it
+        self.start_project_upload()
+        return True
 
     def install_python_and_dependencies(self):
         """Install Python and required system dependencies."""
         self.print_step(4, LABELS.STEP_INSTALL_PYTHON_DEPS)
-        return self._run_remote(f"sudo apt install -y {APT_PACKAGES}")
+        return self._run_remote(f"sudo apt install -y {APT_PACKAGES}", stream=True)
 
     def create_virtual_environment(self):
         """Create and setup Python virtual environment."""
@@ -388,7 +533,63 @@ class SetupTool:
             # Activate and upgrade pip inside the venv
             f"source ~/{REMOTE_VENV_DIR}/bin/activate && pip install --upgrade pip",
         ]
-        return all(self._run_remote(c) for c in cmds)
+        return self._run_remote_script(cmds)
+
+    def _rsync_command(self, src_dir, batch_mode=False):
+        """Generate the rsync argument list that mirrors src_dir into the remote project folder.
+
+        With batch_mode set, the remote shell never prompts for a password.
+        """
+        host = f"{self.config['username']}@{self.config['hostname']}"
+        key = self.config.get("ssh_key_path")
+        remote_argv = ["ssh", *SSH_OPTS, *self._control_opts()]
+        if batch_mode:
+            remote_argv += ["-o", "BatchMode=yes"]
+        if key:
+            remote_argv += ["-i", key]
+        # rsync splits the remote shell command itself, honouring quotes
+        remote_shell = shlex.join(remote_argv)
+        exclude_args = [f"--exclude={x}" for x in RSYNC_EXCLUDES]
+        return [
+            "rsync",
+            "-az",
+            "--delete",
+            "--partial",
+            "--quiet",
+            *exclude_args,
+            "-e",
+            remote_shell,
+            f"{src_dir}/",
+            f"{host}:~/{PROJECT_DIR}/",
+        ]
+
+    def start_project_upload(self):
+        """Start copying the project files in the background.
+
+        The upload only needs the project directory, so it runs while the Pi installs
+        system packages and creates the venv. copy_project_files_initial_setup() waits
+        for it and reports the result.
+
+        It is only started over the shared SSH connection. Without one, rsync's ssh could
+        ask for a password on the terminal while a foreground step is prompting too, so
+        the files are copied in the foreground by copy_project_files_initial_setup() instead.
+        """
+        src_dir = self.script_dir.parent / PROJECT_DIR
+        if self._control_dir and src_dir.exists():
+            self._upload = subprocess.Popen(
+                self._rsync_command(src_dir, batch_mode=True),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+
+    def _cancel_project_upload(self):
+        """Stop a background upload that is no longer needed."""
+        if self._upload:
+            self._upload.terminate()
+            self._upload.wait()
+            self._upload = None
 
     def copy_project_files_initial_setup(self):
         """Copy project files to the Raspberry Pi during initial setup.
@@ -401,23 +602,19 @@ class SetupTool:
         if not src_dir.exists():
             self.print_err(LABELS.ERR_MISSING_SOURCE_DIR.format(src_dir=src_dir))
             return False
-        host = f"{self.config['username']}@{self.config['hostname']}"
-        key = self.config.get("ssh_key_path", "")
-        exclude_args = " ".join([f'--exclude=\"{x}\"' for x in RSYNC_EXCLUDES])
-        rsync_cmd = (
-            f'rsync -az --delete --quiet {exclude_args} '
-            f'-e "ssh -i \'{key}\' {SSH_OPTS}" '
-            f'"{src_dir}/" "{host}:~/{PROJECT_DIR}/"'
-        )
         self.print_info(LABELS.MSG_TRANSFERRING_FILES)
-        result = subprocess.run(
-            rsync_cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False
-        )
-        if result.stdout:
-            self._log(f"[RSYNC] {result.stdout.strip()}")
-        if result.stderr:
-            self._log(f"[RSYNC ERROR] {result.stderr.strip()}")
-        if result.returncode == 0:
+        upload, self._upload = self._upload, None
+        if upload is None:
+            upload = subprocess.Popen(
+                self._rsync_command(src_dir), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+        stdout, stderr = upload.communicate()
+        returncode = upload.returncode
+        if stdout:
+            self._log(f"[RSYNC] {stdout.strip()}")
+        if stderr:
+            self._log(f"[RSYNC ERROR] {stderr.strip()}")
+        if returncode == 0:
             self.print_info(LABELS.MSG_FILES_COPIED)
             return True
         self.print_err(LABELS.ERR_FILE_COPY_FAILED)
@@ -431,31 +628,36 @@ class SetupTool:
             f"source ~/{REMOTE_VENV_DIR}/bin/activate && "
             # rely on --system-site-packages venv; avoid source builds
             f"PIP_NO_BUILD_ISOLATION=1 PIP_ONLY_BINARY=:all: "
-            f"pip install --no-cache-dir -r requirements.txt"
+            # keep pip's wheel cache (~/.cache/pip) so setup re-runs install without downloading again
+            f"pip install -r requirements.txt"
         )
-        return self._run_remote(cmd)
+        return self._run_remote(cmd, stream=True)
 
     def _post_deploy_finalize(self):
-        """Set executable permissions on shell scripts after deployment."""
+        """Set executable permissions on shell scripts and bake the menus after deployment."""
         self.print_step(8, LABELS.STEP_FINALIZE)
-        self._run_remote(
-            f"cd ~/{PROJECT_DIR} && find . -name '*.sh' -exec chmod +x {{}} \\;",
-            desc=LABELS.MSG_EXEC_PERMISSIONS_SET,
-        )
+        self._run_remote(FINALIZE_CMD, desc=LABELS.MSG_EXEC_PERMISSIONS_SET)
+        # The config app falls back to the menu JSON files if baking fails
+        self._run_remote(BAKE_MENUS_CMD, desc=LABELS.MSG_BAKING_MENUS)
         return True
 
-    def launch_config_app(self):
-        """Launch the configuration application on the Raspberry Pi."""
+    def launch_config_app(self, finalize=False):
+        """Launch the configuration application on the Raspberry Pi.
+
+        With finalize set, the script permissions are refreshed and the menus baked in the
+        same SSH session that starts the app instead of in separate ones.
+        """
         self.print_step(9, LABELS.STEP_LAUNCH_APP)
         cmd = f"cd ~/{PROJECT_DIR} && bash spot_config.sh"
+        if finalize:
+            self.print_info(LABELS.MSG_EXEC_PERMISSIONS_SET)
+            self.print_info(LABELS.MSG_BAKING_MENUS)
+            # The config app falls back to the menu JSON files if baking fails
+            cmd = f"{FINALIZE_CMD} && ({BAKE_MENUS_CMD} || true) && {cmd}"
         self.print_info(LABELS.MSG_LAUNCHING_CONFIG_APP)
-        host = f"{self.config['username']}@{self.config['hostname']}"
-        key = self.config.get("ssh_key_path")
-        base = f"ssh -t -o ConnectTimeout={SSH_CONNECT_TIMEOUT} {SSH_OPTS}"
-        ssh_prefix = f'{base} -i "{key}" {host}' if key else f"{base} {host}"
-        full = f'{ssh_prefix} "{cmd}" 2>/dev/null'
+        argv = self._ssh_prefix("-t") + [cmd]
         try:
-            result = subprocess.run(full, shell=True, timeout=3600, check=False)
+            result = subprocess.run(argv, stderr=subprocess.DEVNULL, timeout=3600, check=False)
             return result.returncode == 0
         except Exception as e:
             self.print_err(LABELS.ERR_SSH_COMMAND_FAILED.format(e=e))
@@ -474,27 +676,17 @@ class SetupTool:
             return False
 
         self.print_info(LABELS.MSG_SYNCING_CHANGES)
-        host = f"{self.config['username']}@{self.config['hostname']}"
-        key = self.config.get("ssh_key_path", "")
-        exclude_args = " ".join([f'--exclude=\"{x}\"' for x in RSYNC_EXCLUDES])
-        rsync_cmd = (
-            f'rsync -az --delete --quiet {exclude_args} '
-            f'-e "ssh -i \'{key}\' {SSH_OPTS}" '
-            f'"{src_dir}/" "{host}:~/{PROJECT_DIR}/"'
-        )
-        result = subprocess.run(
-            rsync_cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False
-        )
+        rsync_cmd = self._rsync_command(src_dir)
+        result = subprocess.run(rsync_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=False)
         if result.stdout:
             self._log(f"[RSYNC] {result.stdout.strip()}")
         if result.stderr:
             self._log(f"[RSYNC ERROR] {result.stderr.strip()}")
         if result.returncode == 0:
             self.print_info(LABELS.MSG_FILES_SYNCED)
-            self._post_deploy_finalize()
             if not getattr(self.args, "skip_menu", False):
-                return self.launch_config_app()
-            return True
+                return self.launch_config_app(finalize=True)
+            return self._post_deploy_finalize()
         self.print_err(LABELS.ERR_SYNC_FAILED)
         return False
 
@@ -519,6 +711,7 @@ class SetupTool:
 
         for func, name in steps:
             if not func():
+                self._cancel_project_upload()
                 self.print_err(LABELS.ERR_SETUP_FAILED_AT_STEP.format(name=name))
                 return False
         self.config["setup_completed"] = True
@@ -541,18 +734,21 @@ class SetupTool:
                     return False
                 if not self.collect_initial_config():
                     return False
+                self._open_master()
                 if not self.test_ssh_connection():
                     return False
                 if self.confirm(LABELS.PROMPT_SSH_KEY_AUTH, True):
-                    if self.generate_ssh_keys():
-                        self.copy_ssh_key_to_pi()
+                    if self.generate_ssh_keys() and not self.copy_ssh_key_to_pi():
+                        return False
             else:
                 self.print_info(LABELS.MSG_CONFIG_FOUND)
                 if self.config.get("setup_completed"):
+                    self._open_master()
                     return self.sync_code_changes_after_setup()
                 else:
                     pwd = self.ask(LABELS.PROMPT_PASSWORD, secret=True)
                     self.current_password = pwd
+                    self._open_master()
 
             return self.run_complete_setup()
 
@@ -568,6 +764,9 @@ class SetupTool:
             self._show_cursor()
             return False
         finally:
+            self._cancel_project_upload()
+            self._close_master()
+            self.flush_config()
             self._close_log()
             self._show_cursor()
 
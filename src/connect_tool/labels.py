@@ -24,6 +24,7 @@ ERR_MISSING_REQUIRED = "Hostname, username, and password are required"
 ERR_SSH_TEST_FAILED = "SSH test failed"
 ERR_SSH_KEY_GEN_FAILED = "Failed to generate SSH keys"
 ERR_PUBLIC_KEY_NOT_FOUND = "Public key not found"
+ERR_SSH_KEY_REJECTED = "Raspberry Pi did not accept the installed SSH key"
 ERR_MISSING_SOURCE_DIR = "Missing source directory: {src_dir}"
 ERR_FILE_COPY_FAILED = "File copy failed"
 ERR_SYNC_FAILED = "Sync failed"
@@ -48,9 +49,11 @@ MSG_CONFIG_CLEARED = "Configuration cleared"
 MSG_CONFIG_FOUND = "Existing configuration found"
 MSG_SYNCING_CHANGES = "Syncing code changes..."
 MSG_EXEC_PERMISSIONS_SET = "Setting execute permissions"
+MSG_BAKING_MENUS = "Baking config app menus"
 MSG_CONFIG_FILE_COPIED = "Config file copied"
 MSG_LAUNCHING_CONFIG_APP = "Launching Config App on Raspberry Pi..."
 MSG_TRANSFERRING_FILES = "Transferring project files..."
+MSG_SYSTEM_UPDATE_FRESH = "System packages were updated less than a day ago, skipping"
 
 # Warning messages
 WARN_CONFIG_FILE_NOT_FOUND = "{config_filename} not found locally"
@@ -70,8 +73,7 @@ STEP_FINALIZE = "Finalize Setup"
 STEP_LAUNCH_APP = "Launch Config App"
 
 # Sub-step descriptions
-SUBSTEP_UPDATING_PACKAGES = "Updating package list"
-SUBSTEP_UPGRADING_PACKAGES = "Upgrading packages"
+SUBSTEP_UPDATING_AND_UPGRADING = "Updating package list and upgrading packages"
 SUBSTEP_INSTALLING_SSH_KEY = "Installing SSH key on Raspberry Pi"
 SUBSTEP_TESTING_SSH = "Testing SSH connectivity..."
 
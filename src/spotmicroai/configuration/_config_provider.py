@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import json
 from pathlib import Path
@@ -13,9 +13,10 @@ from spotmicroai.singleton import Singleton
 log = Logger().setup_logger('Configuration')
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServoConfig:
-    """Servo configuration dataclass"""
+    """Servo configuration dataclass. Frozen so instances can be shared from the provider cache,
+    slotted since the fields are read on every servo lookup."""
 
     channel: int
     min_pulse: float
@@ -59,6 +60,8 @@ class ConfigProvider(metaclass=Singleton):
 
     def __init__(self) -> None:
         self._raw_data: Dict[str, Any] = {}
+        # ServoConfig objects built from _raw_data, invalidated whenever servo data changes
+        self._servo_configs: Dict[ServoName, ServoConfig] = {}
 
         try:
             log.debug(labels.CONFIG_LOADING)
@@ -80,6 +83,7 @@ class ConfigProvider(metaclass=Singleton):
 
             with open(config_path, encoding='utf-8') as json_file:
                 self._raw_data = json.load(json_file)
+                self._servo_configs.clear()
                 log.debug(labels.CONFIG_LOADED_FROM.format(config_path))
 
         except FileNotFoundError:
@@ -197,9 +201,12 @@ class ConfigProvider(metaclass=Singleton):
             channel = servo.channel
             min_pulse = servo.min_pulse
         """
-        key = self._get_servo_key(servo_name)
-        data = self._raw_data[key]
-        return ServoConfig(channel=data['channel'], min_pulse=data['min_pulse'], max_pulse=data['max_pulse'])
+        servo = self._servo_configs.get(servo_name)
+        if servo is None:
+            data = self._raw_data[self._get_servo_key(servo_name)]
+            servo = ServoConfig(channel=data['channel'], min_pulse=data['min_pulse'], max_pulse=data['max_pulse'])
+            self._servo_configs[servo_name] = servo
+        return servo
 
     def set_servo(self, servo_name: ServoName, servo: ServoConfig) -> None:
         """
@@ -211,6 +218,7 @@ class ConfigProvider(metaclass=Singleton):
         """
         key = self._get_servo_key(servo_name)
         self._raw_data[key] = {'channel': servo.channel, 'min_pulse': servo.min_pulse, 'max_pulse': servo.max_pulse}
+        self._servo_configs[servo_name] = servo
 
     def get_servo_channel(self, servo_name: ServoName) -> int:
         """Get the PWM channel for a servo"""
@@ -219,9 +227,7 @@ class ConfigProvider(metaclass=Singleton):
 
     def set_servo_channel(self, servo_name: ServoName, channel: int) -> None:
         """Set the PWM channel for a servo"""
-        servo = self.get_servo_config(servo_name)
-        servo.channel = channel
-        self.set_servo(servo_name, servo)
+        self.set_servo(servo_name, replace(self.get_servo_config(servo_name), channel=channel))
 
     def get_servo_min_pulse(self, servo_name: ServoName) -> float:
         """Get the minimum pulse width for a servo"""
@@ -230,9 +236,7 @@ class ConfigProvider(metaclass=Singleton):
 
     def set_servo_min_pulse(self, servo_name: ServoName, pulse: float) -> None:
         """Set the minimum pulse width for a servo"""
-        servo = self.get_servo_config(servo_name)
-        servo.min_pulse = pulse
-        self.set_servo(servo_name, servo)
+        self.set_servo(servo_name, replace(self.get_servo_config(servo_name), min_pulse=pulse))
 
     def get_servo_max_pulse(self, servo_name: ServoName) -> float:
         """Get the maximum pulse width for a servo"""
@@ -241,9 +245,7 @@ class ConfigProvider(metaclass=Singleton):
 
     def set_servo_max_pulse(self, servo_name: ServoName, pulse: float) -> None:
         """Set the maximum pulse width for a servo"""
-        servo = self.get_servo_config(servo_name)
-        servo.max_pulse = pulse
-        self.set_servo(servo_name, servo)
+        self.set_servo(servo_name, replace(self.get_servo_config(servo_name), max_pulse=pulse))
 
     def get_all_servos(self) -> Dict[ServoName, ServoConfig]:
         """Get all servo configurations as ServoConfig dataclasses"""
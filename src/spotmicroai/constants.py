@@ -11,6 +11,8 @@ SAFE_NEUTRAL = (0.0, 0.0, 0.0)
 # FOOT_SERVO_OFFSET = 0
 ROTATION_OFFSET = 40
 INACTIVITY_TIME = 10
+# Analog stick magnitude below which body moves are skipped, to ignore stick drift
+BODY_MOVE_DEADZONE = 0.05
 
 # Walking speed
 MAX_WALKING_SPEED = 15
@@ -30,6 +32,16 @@ DEFAULT_DEBOUNCE_TIME = 0.5
 
 FRAME_RATE_HZ = 50
 FRAME_DURATION = 1.0 / FRAME_RATE_HZ
+# Frame duration as integer nanoseconds, for deadline arithmetic on time.monotonic_ns()
+FRAME_DURATION_NS = 1_000_000_000 // FRAME_RATE_HZ
+# Time servos are given to settle after activation, during which buttons are ignored
+SERVO_SETTLE_TIME = 0.25
+# Time buttons are ignored after a walking toggle or pose change
+BUTTON_SETTLE_TIME = 0.5
+# SCHED_FIFO priorities of the real-time controller processes. The abort controller
+# outranks the motion loop so an abort is never starved by frame work.
+MOTION_FIFO_PRIORITY = 50
+ABORT_FIFO_PRIORITY = 60
 TELEMETRY_UPDATE_INTERVAL = 2  # Update telemetry display every N frames
 
 # Diagnostics Constants
@@ -37,6 +49,11 @@ SWEEP_RATE_DEG_PER_FRAME = 0.5  # Configurable sweep rate: degrees per frame (ad
 
 DEFAULT_SLEEP = 0.1
 
+# Abort controller GPIO setup at boot: total time allowed for the GPIO device to become
+# usable, and the delay between attempts
+GPIO_READY_TIMEOUT = 20.0
+GPIO_RETRY_INTERVAL = 0.05
+
 
 # Controller Constants
 # ===============================
@@ -44,6 +61,8 @@ DEFAULT_SLEEP = 0.1
 # ===============================
 # Rate (in Hz) at which the current joystick state is broadcast to the motion queue.
 PUBLISH_RATE_HZ = 20.0
+# Publish period as integer nanoseconds, for deadline arithmetic on time.monotonic_ns()
+PUBLISH_PERIOD_NS = int(1e9 / PUBLISH_RATE_HZ)
 # Delay between read loop iterations (in seconds)
 READ_LOOP_SLEEP = 0.01
 # ===============================
@@ -2,7 +2,7 @@
 Buzzer handler for controlling audio feedback on GPIO.
 """
 
-import time
+import threading
 
 from RPi import GPIO  # type: ignore
 
@@ -20,6 +20,8 @@ class Buzzer(metaclass=Singleton):
         Configuration object for motion controller settings
     _port : int
         GPIO port number for the buzzer
+    _off_timer : threading.Timer | None
+        Pending timer that silences the current beep
     """
 
     config_provider = ConfigProvider()
@@ -31,9 +33,22 @@ class Buzzer(metaclass=Singleton):
         GPIO.setmode(GPIO.BCM)
         GPIO.setup(self._port, GPIO.OUT)
         GPIO.output(self._port, False)
+        self._off_timer: threading.Timer | None = None
 
     def beep(self):
-        """Plays a beep sound by activating the buzzer for the configured beep duration."""
+        """Plays a beep sound by activating the buzzer for the configured beep duration.
+
+        Returns immediately; a timer switches the buzzer off, so callers such as the
+        motion loop are not held up for the length of the beep. A beep started while
+        another is sounding extends it.
+        """
+        if self._off_timer is not None:
+            self._off_timer.cancel()
         GPIO.output(self._port, True)
-        time.sleep(constants.BEEP_DURATION)
+        # Not a daemon, so a beep started just before shutdown is still silenced
+        self._off_timer = threading.Timer(constants.BEEP_DURATION, self._silence)
+        self._off_timer.start()
+
+    def _silence(self):
+        """Switch the buzzer off at the end of a beep."""
         GPIO.output(self._port, False)
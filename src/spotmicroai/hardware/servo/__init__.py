@@ -1,9 +1,23 @@
 """Servo module with calibration support."""
 
+from typing import TYPE_CHECKING, Any
+
 from spotmicroai.hardware.servo._angle_limits import AngleLimits, JOINT_ANGLE_LIMITS
 from spotmicroai.hardware.servo._joint_type import JointType
 from spotmicroai.hardware.servo._servo import Servo
 from spotmicroai.hardware.servo._servo_factory import ServoFactory
-from spotmicroai.hardware.servo.servo_service import ServoService
+
+if TYPE_CHECKING:
+    from spotmicroai.hardware.servo.servo_service import ServoService
 
 __all__ = ["Servo", "JointType", "ServoFactory", "AngleLimits", "JOINT_ANGLE_LIMITS", "ServoService"]
+
+
+def __getattr__(name: str) -> Any:
+    # ServoService pulls in the buzzer (RPi.GPIO) and the motion models, which the
+    # single-servo spot_config tools never use, so it is imported on first access only.
+    if name == "ServoService":
+        from spotmicroai.hardware.servo.servo_service import ServoService
+
+        return ServoService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
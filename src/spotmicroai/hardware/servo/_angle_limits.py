@@ -6,7 +6,7 @@ from typing import Dict
 from spotmicroai.hardware.servo._joint_type import JointType
 
 
-@dataclass
+@dataclass(slots=True)
 class AngleLimits:
     """Defines the angle limits for a servo joint."""
 
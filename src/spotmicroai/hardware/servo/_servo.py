@@ -88,13 +88,30 @@ class Servo:
         Args:
             value: Target angle in degrees
         """
+        self._pwm_channel.duty_cycle = self.duty_cycle_for_angle(value)
+
+    def duty_cycle_for_angle(self, value: float) -> int:
+        """
+        Compute the 16-bit duty cycle for a physical angle without writing it.
+
+        Applies the same angle and pulse clamps as the ``angle`` setter, so callers
+        can batch several servos into a single PCA9685 write.
+
+        Args:
+            value: Target angle in degrees
+
+        Returns:
+            The duty cycle in the 0-65535 range used by the PWM channel.
+        """
         # Clamp to valid angle range
         clamped_angle = max(self._min_angle, min(self._max_angle, value))
 
-        # Convert physical angle to pulse width
+        # Convert physical angle to pulse width and clamp it to the calibrated range
         pulse = self._angle_to_pulse(clamped_angle)
-        # Set the pulse
-        self.pulse = pulse
+        min_pulse_abs = min(self._min_pulse, self._max_pulse)
+        max_pulse_abs = max(self._min_pulse, self._max_pulse)
+        clamped_pulse = max(min_pulse_abs, min(max_pulse_abs, pulse))
+        return int((clamped_pulse / 20000.0) * 65535)
 
     @property
     def pulse(self) -> float:
@@ -124,6 +141,24 @@ class Servo:
         """Low-level helper to send a pulse width to the PWM channel."""
         self._pwm_channel.duty_cycle = int((pulse_us / 20000.0) * 65535)
 
+    def duty_cycle_coefficients(self) -> tuple[float, float]:
+        """
+        Linear coefficients of the angle to duty-cycle conversion.
+
+        For an angle already clamped to [min_angle, max_angle] the duty cycle is
+        ``int(offset + gain * angle)``, matching ``duty_cycle_for_angle``. Inverted
+        servos are covered because the mapping is linear from min_angle/min_pulse
+        to max_angle/max_pulse either way.
+
+        Returns:
+            A ``(gain, offset)`` tuple.
+        """
+        pulse_per_degree = (self._max_pulse - self._min_pulse) / self._angle_range
+        duty_per_us = 65535 / 20000.0
+        gain = pulse_per_degree * duty_per_us
+        offset = (self._min_pulse - self._min_angle * pulse_per_degree) * duty_per_us
+        return gain, offset
+
     @property
     def min_pulse(self) -> float:
         """Get the minimum pulse width in microseconds."""
@@ -4,7 +4,7 @@ Manages PCA9685 board initialization and direct servo control during calibration
 Provides pulse width and angle-based servo positioning with safety clamping.
 """
 
-from spotmicroai.configuration._config_provider import ConfigProvider, ServoName
+from spotmicroai.configuration._config_provider import ConfigProvider, ServoConfig, ServoName
 from spotmicroai.constants import SERVO_PULSE_WIDTH_MAX, SERVO_PULSE_WIDTH_MIN
 from spotmicroai.labels import (
     ERR_SERVO_CONFIG_MAX_PULSE_OUT_OF_RANGE,
@@ -56,11 +56,14 @@ class ServoFactory:
             )
 
     @staticmethod
-    def create(servo_name: ServoName) -> Servo:
+    def create(servo_name: ServoName, servo_config: ServoConfig | None = None) -> Servo:
         """Create and initialize a servo instance.
 
         Args:
             servo_name: The ServoName enum value for the servo to create.
+            servo_config: Already-loaded configuration for the servo. When omitted it is
+                read from the ConfigProvider, so callers creating many servos can load
+                the configuration once and pass it in.
 
         Returns:
             A fully initialized Servo instance.
@@ -68,14 +71,13 @@ class ServoFactory:
         Raises:
             RuntimeError: If PCA9685 board fails to initialize or servo not found.
         """
-        config_provider = ConfigProvider()
-
-        # Initialize PCA9685 board
+        # Initialize PCA9685 board, reusing it if it is already active
         pca9685 = PCA9685()
-        pca9685.activate_board()
+        pca9685.ensure_ready()
 
         # Get servo configuration
-        servo_config = config_provider.get_servo_config(servo_name)
+        if servo_config is None:
+            servo_config = ConfigProvider().get_servo_config(servo_name)
         channel = pca9685.get_channel(servo_config.channel)
 
         # Validate pulse width configuration
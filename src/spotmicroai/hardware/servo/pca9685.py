@@ -2,6 +2,9 @@
 PCA9685 handler for controlling PWM board on I2C.
 """
 
+import struct
+import threading
+
 from adafruit_pca9685 import PCA9685 as _PCA9685  # type: ignore
 from board import SCL, SDA  # type: ignore
 import busio  # type: ignore
@@ -12,47 +15,117 @@ from spotmicroai.logger import Logger
 
 log = Logger().setup_logger('Motion controller')
 
+# LED0_ON_L; each channel owns four consecutive registers (ON_L, ON_H, OFF_L, OFF_H)
+_LED0_ON_L = 0x06
+_LED_REGISTERS = struct.Struct('<HH')
+
 
 class PCA9685(metaclass=Singleton):
     """Controls the PCA9685 PWM board for servo control.
 
     Attributes
     ----------
-    config : Config
-        Configuration object for motion controller settings
     _i2c : busio.I2C
         I2C bus interface
     _pca9685 : PCA9685 or None
         PCA9685 board instance
-    _address : int
-        I2C address of the PCA9685 board
+    _address : int or None
+        I2C address of the PCA9685 board, None until the configuration is loaded
     _reference_clock_speed : int
         Reference clock speed for the PCA9685
     _frequency : int
         PWM frequency
     """
 
-    config_provider = ConfigProvider()
+    # Board settings, read from the configuration once on first activation
+    _address: int | None = None
+    _reference_clock_speed: int = 0
+    _frequency: int = 0
 
     def __init__(self) -> None:
         """Initialize the PCA9685Board."""
         self._i2c = busio.I2C(SCL, SDA)
         self._pca9685 = None
-        self._address: int = self.config_provider.get_pca9685_address()
-        self._reference_clock_speed: int = self.config_provider.get_pca9685_reference_clock_speed()
-        self._frequency: int = self.config_provider.get_pca9685_frequency()
+        self._activation_thread: threading.Thread | None = None
+
+    @classmethod
+    def _load_config(cls) -> None:
+        """Read the board address, reference clock and frequency from the configuration."""
+        config_provider = ConfigProvider()
+        cls._address = config_provider.get_pca9685_address()
+        cls._reference_clock_speed = config_provider.get_pca9685_reference_clock_speed()
+        cls._frequency = config_provider.get_pca9685_frequency()
 
     def activate_board(self):
         """Activate the PCA9685 board."""
+        if self._address is None:
+            self._load_config()
         self._pca9685 = _PCA9685(self._i2c, address=self._address, reference_clock_speed=self._reference_clock_speed)
         self._pca9685.frequency = self._frequency
 
+    def activate_async(self) -> None:
+        """Start activating the board on a background thread.
+
+        Lets callers overlap the I2C setup with other start-up work; ensure_ready()
+        waits for it to finish before the board is used.
+        """
+        if self._pca9685 is not None or self._activation_thread is not None:
+            return
+        self._activation_thread = threading.Thread(target=self.activate_board, daemon=True)
+        self._activation_thread.start()
+
+    def ensure_ready(self) -> None:
+        """Make sure the board is active, waiting for a pending background activation if any."""
+        if self._activation_thread is not None:
+            self._activation_thread.join()
+            self._activation_thread = None
+        if self._pca9685 is None:
+            self.activate_board()
+
     def deactivate_board(self):
         """Deactivate the PCA9685 board."""
         if self._pca9685:
             self._pca9685.deinit()
             self._pca9685 = None
 
+    @property
+    def is_active(self) -> bool:
+        """Whether the board has been activated and can accept writes."""
+        return self._pca9685 is not None
+
+    def write_channels(self, first_channel: int, duty_cycles) -> None:
+        """Write duty cycles to consecutive channels in a single I2C block write.
+
+        The PCA9685 auto-increments its register pointer, so all LED registers
+        for the run of channels are sent in one transaction instead of one per channel.
+
+        Parameters
+        ----------
+        first_channel : int
+            Index of the first channel to write
+        duty_cycles : Sequence[int]
+            16-bit duty cycles, one per consecutive channel, encoded like PWMChannel.duty_cycle
+        """
+        if self._pca9685 is None:
+            raise RuntimeError('PCA9685 board not activated')
+
+        buffer = bytearray(1 + _LED_REGISTERS.size * len(duty_cycles))
+        buffer[0] = _LED0_ON_L + _LED_REGISTERS.size * first_channel
+        offset = 1
+        for duty_cycle in duty_cycles:
+            if duty_cycle >= 0xFFFF:
+                # Fully on
+                _LED_REGISTERS.pack_into(buffer, offset, 0x1000, 0)
+            elif duty_cycle < 0x0010:
+                # Fully off
+                _LED_REGISTERS.pack_into(buffer, offset, 0, 0x1000)
+            else:
+                _LED_REGISTERS.pack_into(buffer, offset, 0, duty_cycle >> 4)
+            offset += _LED_REGISTERS.size
+
+        with self._pca9685.i2c_device as i2c:
+            i2c.write(buffer)
+
     def get_channel(self, channel_index):
         """Get a PWM channel by index.
 
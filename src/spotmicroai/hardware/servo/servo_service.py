@@ -3,9 +3,12 @@ Servo service for managing and controlling all 12 servos on the SpotMicroAI robo
 Provides high-level interface for setting servo angles, committing changes, and managing poses.
 """
 
+from typing import List, Tuple
+
 from spotmicroai.singleton import Singleton
 from spotmicroai.configuration._config_provider import ConfigProvider, ServoName
 from spotmicroai.runtime.motion_controller.models.pose import Pose
+from spotmicroai.hardware.servo._servo import Servo
 from spotmicroai.hardware.servo._servo_factory import ServoFactory
 from spotmicroai.hardware.servo.pca9685 import PCA9685
 from spotmicroai.hardware.buzzer.buzzer import Buzzer
@@ -14,77 +17,128 @@ from spotmicroai.logger import Logger
 log = Logger().setup_logger('ServoService')
 
 
+# Servos in the order they are created and staged. The staged angle of each
+# servo is the public ``<name>_angle`` attribute.
+_SERVO_NAMES = (
+    ServoName.REAR_SHOULDER_LEFT,
+    ServoName.REAR_LEG_LEFT,
+    ServoName.REAR_FOOT_LEFT,
+    ServoName.REAR_SHOULDER_RIGHT,
+    ServoName.REAR_LEG_RIGHT,
+    ServoName.REAR_FOOT_RIGHT,
+    ServoName.FRONT_SHOULDER_LEFT,
+    ServoName.FRONT_LEG_LEFT,
+    ServoName.FRONT_FOOT_LEFT,
+    ServoName.FRONT_SHOULDER_RIGHT,
+    ServoName.FRONT_LEG_RIGHT,
+    ServoName.FRONT_FOOT_RIGHT,
+)
+
+
 class ServoService(metaclass=Singleton):
     """Manages and controls all 12 servos using configuration loaded via Config (DotDict-enabled)."""
 
+    # Staged angles, applied to the servos on commit()
+    rear_shoulder_left_angle: float
+    rear_leg_left_angle: float
+    rear_foot_left_angle: float
+    rear_shoulder_right_angle: float
+    rear_leg_right_angle: float
+    rear_foot_right_angle: float
+    front_shoulder_left_angle: float
+    front_leg_left_angle: float
+    front_foot_left_angle: float
+    front_shoulder_right_angle: float
+    front_leg_right_angle: float
+    front_foot_right_angle: float
+
     def __init__(self):
         self._config_provider = ConfigProvider()
         self._pca9685_board = PCA9685()
         self._buzzer = Buzzer()
 
-        # --- Initialize physical servo objects ---
-        self._rear_shoulder_left = ServoFactory.create(ServoName.REAR_SHOULDER_LEFT)
-        self._rear_leg_left = ServoFactory.create(ServoName.REAR_LEG_LEFT)
-        self._rear_foot_left = ServoFactory.create(ServoName.REAR_FOOT_LEFT)
-
-        self._rear_shoulder_right = ServoFactory.create(ServoName.REAR_SHOULDER_RIGHT)
-        self._rear_leg_right = ServoFactory.create(ServoName.REAR_LEG_RIGHT)
-        self._rear_foot_right = ServoFactory.create(ServoName.REAR_FOOT_RIGHT)
-
-        self._front_shoulder_left = ServoFactory.create(ServoName.FRONT_SHOULDER_LEFT)
-        self._front_leg_left = ServoFactory.create(ServoName.FRONT_LEG_LEFT)
-        self._front_foot_left = ServoFactory.create(ServoName.FRONT_FOOT_LEFT)
+        # Load every servo configuration once instead of once per servo
+        servo_configs = self._config_provider.get_all_servos()
 
-        self._front_shoulder_right = ServoFactory.create(ServoName.FRONT_SHOULDER_RIGHT)
-        self._front_leg_right = ServoFactory.create(ServoName.FRONT_LEG_RIGHT)
-        self._front_foot_right = ServoFactory.create(ServoName.FRONT_FOOT_RIGHT)
+        # --- Initialize physical servo objects ---
+        # (servo, staged angle attribute) pairs in _SERVO_NAMES order
+        self._servos: List[Tuple[Servo, str]] = []
+        for servo_name in _SERVO_NAMES:
+            servo = ServoFactory.create(servo_name, servo_configs.get(servo_name))
+            self._servos.append((servo, f'{servo_name.value}_angle'))
 
         # Initialize staged angles to rest positions
-        self.rear_shoulder_left_angle = self._rear_shoulder_left.rest_angle
-        self.rear_leg_left_angle = self._rear_leg_left.rest_angle
-        self.rear_foot_left_angle = self._rear_foot_left.rest_angle
-        self.rear_shoulder_right_angle = self._rear_shoulder_right.rest_angle
-        self.rear_leg_right_angle = self._rear_leg_right.rest_angle
-        self.rear_foot_right_angle = self._rear_foot_right.rest_angle
-        self.front_shoulder_left_angle = self._front_shoulder_left.rest_angle
-        self.front_leg_left_angle = self._front_leg_left.rest_angle
-        self.front_foot_left_angle = self._front_foot_left.rest_angle
-        self.front_shoulder_right_angle = self._front_shoulder_right.rest_angle
-        self.front_leg_right_angle = self._front_leg_right.rest_angle
-        self.front_foot_right_angle = self._front_foot_right.rest_angle
-
-        # Initialize staged angles
         self.clear_staged()
 
+        # Servos ordered by PCA9685 channel, paired with their staged angle attribute.
+        # commit() sends one block write per run of consecutive channels.
+        servos_by_channel = sorted(
+            [
+                (servo_configs[servo_name].channel, servo, attribute)
+                for servo_name, (servo, attribute) in zip(_SERVO_NAMES, self._servos)
+            ],
+            key=lambda entry: entry[0],
+        )
+        channels = [channel for channel, _, _ in servos_by_channel]
+
+        # (first channel, start, end) slices of the commit tuples below, one per run of
+        # consecutive channels. Left empty if a channel is shared, which forces per-servo writes.
+        self._commit_runs: List[Tuple[int, int, int]] = []
+        if len(set(channels)) == len(channels):
+            start = 0
+            for index in range(1, len(channels) + 1):
+                if index == len(channels) or channels[index] != channels[index - 1] + 1:
+                    self._commit_runs.append((channels[start], start, index))
+                    start = index
+
+        # Conversion parameters for the block write, stored as parallel tuples in channel order
+        self._commit_attributes = tuple(attribute for _, _, attribute in servos_by_channel)
+        self._commit_min_angles = tuple(servo.min_angle for _, servo, _ in servos_by_channel)
+        self._commit_max_angles = tuple(servo.max_angle for _, servo, _ in servos_by_channel)
+        coefficients = [servo.duty_cycle_coefficients() for _, servo, _ in servos_by_channel]
+        self._commit_gains = tuple(gain for gain, _ in coefficients)
+        self._commit_offsets = tuple(offset for _, offset in coefficients)
+
+        # Lower/upper bound for every staged angle, taken from each servo's joint limits
+        self._staged_limits = tuple((attribute, servo.min_angle, servo.max_angle) for servo, attribute in self._servos)
+
     def commit(self):
         """Apply all staged servo angles to their respective servo objects."""
-        self._rear_shoulder_left.angle = self.rear_shoulder_left_angle
-        self._rear_leg_left.angle = self.rear_leg_left_angle
-        self._rear_foot_left.angle = self.rear_foot_left_angle
-        self._rear_shoulder_right.angle = self.rear_shoulder_right_angle
-        self._rear_leg_right.angle = self.rear_leg_right_angle
-        self._rear_foot_right.angle = self.rear_foot_right_angle
-        self._front_shoulder_left.angle = self.front_shoulder_left_angle
-        self._front_leg_left.angle = self.front_leg_left_angle
-        self._front_foot_left.angle = self.front_foot_left_angle
-        self._front_shoulder_right.angle = self.front_shoulder_right_angle
-        self._front_leg_right.angle = self.front_leg_right_angle
-        self._front_foot_right.angle = self.front_foot_right_angle
+        if self._commit_runs and self._pca9685_board.is_active:
+            duty_cycles = [
+                int(offset + gain * (lower if angle < lower else upper if angle > upper else angle))
+                for angle, lower, upper, gain, offset in zip(
+                    [getattr(self, attribute) for attribute in self._commit_attributes],
+                    self._commit_min_angles,
+                    self._commit_max_angles,
+                    self._commit_gains,
+                    self._commit_offsets,
+                )
+            ]
+            write_channels = self._pca9685_board.write_channels
+            for first_channel, start, end in self._commit_runs:
+                write_channels(first_channel, duty_cycles[start:end])
+            return
+
+        for servo, attribute in self._servos:
+            servo.angle = getattr(self, attribute)
+
+    def clamp_staged(self):
+        """Clamp all staged servo angles to their joint limits in a single pass.
+
+        Keeps accumulated adjustments from winding up past what the servos can reach.
+        """
+        for attribute, lower, upper in self._staged_limits:
+            value = getattr(self, attribute)
+            if value < lower:
+                setattr(self, attribute, lower)
+            elif value > upper:
+                setattr(self, attribute, upper)
 
     def clear_staged(self):
         """Reset all staged servo angles to their configured rest angles."""
-        self.rear_shoulder_left_angle = self._rear_shoulder_left.rest_angle
-        self.rear_leg_left_angle = self._rear_leg_left.rest_angle
-        self.rear_foot_left_angle = self._rear_foot_left.rest_angle
-        self.rear_shoulder_right_angle = self._rear_shoulder_right.rest_angle
-        self.rear_leg_right_angle = self._rear_leg_right.rest_angle
-        self.rear_foot_right_angle = self._rear_foot_right.rest_angle
-        self.front_shoulder_left_angle = self._front_shoulder_left.rest_angle
-        self.front_leg_left_angle = self._front_leg_left.rest_angle
-        self.front_foot_left_angle = self._front_foot_left.rest_angle
-        self.front_shoulder_right_angle = self._front_shoulder_right.rest_angle
-        self.front_leg_right_angle = self._front_leg_right.rest_angle
-        self.front_foot_right_angle = self._front_foot_right.rest_angle
+        for servo, attribute in self._servos:
+            setattr(self, attribute, servo.rest_angle)
 
     def rest_position(self):
         """Return the robot to its rest position."""
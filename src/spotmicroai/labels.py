@@ -5,6 +5,8 @@ This module contains all user-facing strings used in the menu system.
 Centralizing them here makes it easier to support multiple languages in the future.
 """
 
+import sys
+
 # Error messages for terminal size
 MSG_TERMINAL_TOO_SMALL = "Terminal too small!"
 MSG_RESIZE_CONTINUE = "Please resize to continue"
@@ -18,6 +20,7 @@ MSG_INVALID_ACTION = "Invalid action: {}"
 MSG_INVALID_SUBMENU_TARGET = "Invalid or missing submenu target."
 MSG_SUBMENU_NOT_FOUND = "Submenu '{}' not found."
 MSG_MISSING_COMMAND = "Missing 'command' field for action 'run'"
+MSG_INVALID_SUBMENU_PARAMS = "Invalid parameters for submenu"
 
 # Command execution messages
 MSG_RUNNING_COMMAND = "[INFO] Running: {}"
@@ -175,6 +178,7 @@ MOTION_TELEMETRY_QUEUE_FULL = "Telemetry queue full, dropping oldest frame"
 MOTION_TELEMETRY_UNAVAILABLE = "Telemetry queue not available; telemetry data dropped"
 MOTION_TELEMETRY_ERROR = "Telemetry dispatch error: {}"
 MOTION_REACTIVATE_SERVOS = 'Press START/OPTIONS to re-enable the servos'
+MOTION_QUEUE_HIGH_WATER = "Motion queue high-water mark: {} events drained in one frame"
 
 # Main Runtime
 MAIN_MESSAGE_BUS_CREATED = 'Created the message bus'
@@ -184,6 +188,10 @@ MAIN_STARTING = 'Spotmicro starting...'
 MAIN_TERMINATED_CTRL_C = 'Terminated due Control+C was pressed'
 MAIN_TERMINATED_NORMAL = 'Normal termination'
 
+# Real-time Scheduling
+REALTIME_FIFO_ENABLED = 'Running with SCHED_FIFO priority {}'
+REALTIME_FIFO_UNAVAILABLE = 'Could not enable SCHED_FIFO priority {} (needs CAP_SYS_NICE or LimitRTPRIO): {}'
+
 # LCD Screen Controller
 LCD_STARTING_CONTROLLER = 'Starting controller...'
 LCD_INIT_ERROR = 'LCD Screen controller initialization problem, module not critical, skipping: {}'
@@ -248,3 +256,14 @@ IK_ERROR_LOG = "IK error for {}: {}"
 
 # Diagnostics
 DIAG_COMPLETED_SUCCESSFULLY = "✓ Diagnostics completed successfully"
+
+
+def _intern_menu_messages() -> None:
+    """Intern the fixed (non-template) MSG_ strings used by the menu renderer."""
+    module_globals = globals()
+    for name, value in list(module_globals.items()):
+        if name.startswith('MSG_') and isinstance(value, str) and '{' not in value:
+            module_globals[name] = sys.intern(value)
+
+
+_intern_menu_messages()
@@ -7,12 +7,12 @@ import sys
 import time
 from typing import Optional
 
-import RPi.GPIO as GPIO  # type: ignore
-
 from spotmicroai import labels
+from spotmicroai.constants import ABORT_FIFO_PRIORITY, GPIO_READY_TIMEOUT, GPIO_RETRY_INTERVAL
 from spotmicroai.configuration import ConfigProvider
 from spotmicroai.logger import Logger
 from spotmicroai.runtime.messaging import LcdMessage, MessageAbortCommand, MessageBus, MessageTopic, MessageTopicStatus
+from spotmicroai.runtime.realtime import enable_fifo
 from spotmicroai.singleton import Singleton
 
 log = Logger().setup_logger('Abort controller')
@@ -22,7 +22,9 @@ class AbortController(metaclass=Singleton):
     """Handles abort signals and GPIO for graceful shutdown."""
 
     _gpio_port: Optional[int] = None
-    _config_provider: ConfigProvider = ConfigProvider()
+    _config_provider: ConfigProvider
+    # Last status sent to the LCD, so repeated aborts or activations send nothing
+    _last_lcd_status: Optional[MessageTopicStatus] = None
 
     def __init__(self):
 
@@ -30,6 +32,13 @@ class AbortController(metaclass=Singleton):
 
             log.debug(labels.ABORT_STARTING_CONTROLLER)
 
+            # Imported here rather than at module level so importing this module
+            # does not load the GPIO driver or read the configuration
+            import RPi.GPIO as GPIO  # type: ignore
+
+            self._gpio = GPIO
+            self._config_provider = ConfigProvider()
+
             signal.signal(signal.SIGINT, self.exit_gracefully)
             signal.signal(signal.SIGTERM, self.exit_gracefully)
 
@@ -41,35 +50,42 @@ class AbortController(metaclass=Singleton):
             self._initialize_gpio()
 
             self.abort()
-            self._lcd_topic.put(LcdMessage(MessageTopic.ABORT, MessageTopicStatus.ON))
+            self._publish_lcd_status(MessageTopicStatus.ON)
 
         except Exception as e:
             log.error(labels.ABORT_INIT_ERROR, e)
-            self._lcd_topic.put(LcdMessage(MessageTopic.ABORT, MessageTopicStatus.NOK))
+            self._publish_lcd_status(MessageTopicStatus.NOK)
             try:
                 self.abort()
             finally:
                 sys.exit(1)
 
-    def _initialize_gpio(self, max_retries: int = 10, retry_delay: float = 2.0) -> None:
+    def _initialize_gpio(self, timeout: float = GPIO_READY_TIMEOUT, retry_delay: float = GPIO_RETRY_INTERVAL) -> None:
         """Initialize GPIO with retry logic for systemd service startup.
 
         When running as a systemd service, GPIO may not be immediately accessible.
-        This method retries initialization to handle this race condition.
+        This method retries initialization until ``timeout`` to handle this race
+        condition. Retries are short so setup completes as soon as the GPIO device
+        becomes usable; the warning is logged only for the first failure.
         """
-        for attempt in range(1, max_retries + 1):
+        log.info(labels.ABORT_ATTEMPTING_GPIO)
+        deadline = time.monotonic() + timeout
+        warned = False
+        while True:
             try:
-                log.info(labels.ABORT_ATTEMPTING_GPIO)
-                GPIO.setmode(GPIO.BCM)
+                gpio = self._gpio
+                gpio.setmode(gpio.BCM)
                 assert self._gpio_port is not None
-                GPIO.setup(self._gpio_port, GPIO.OUT)
+                gpio.setup(self._gpio_port, gpio.OUT)
                 log.info(labels.ABORT_GPIO_SUCCESS)
                 return
             except Exception as e:
-                if attempt == max_retries:
+                if time.monotonic() >= deadline:
                     log.error(labels.ABORT_GPIO_ERROR)
                     raise
-                log.warning(labels.ABORT_GPIO_WARNING, e)
+                if not warned:
+                    log.warning(labels.ABORT_GPIO_WARNING, e)
+                    warned = True
                 time.sleep(retry_delay)
 
     def exit_gracefully(self, _signum, _frame):
@@ -80,28 +96,38 @@ class AbortController(metaclass=Singleton):
             sys.exit(0)
 
     def do_process_events_from_queues(self):
+        enable_fifo(ABORT_FIFO_PRIORITY)
+
+        # Handlers indexed by MessageAbortCommand value
+        dispatch = {
+            MessageAbortCommand.ACTIVATE: self.activate_servos,
+            MessageAbortCommand.ABORT: self.abort,
+        }
+        get_event = self._abort_topic.get
 
         try:
             while True:
-                event = self._abort_topic.get()
-
-                if event == MessageAbortCommand.ACTIVATE:
-                    self.activate_servos()
-
-                if event == MessageAbortCommand.ABORT:
-                    self.abort()
+                handler = dispatch.get(get_event())
+                if handler is not None:
+                    handler()
 
         except Exception as e:
             log.error(labels.ABORT_QUEUE_ERROR, e)
             sys.exit(1)
 
+    def _publish_lcd_status(self, status: MessageTopicStatus) -> None:
+        """Send the abort status to the LCD screen if it differs from the last one sent."""
+        if status != self._last_lcd_status:
+            self._lcd_topic.put(LcdMessage(MessageTopic.ABORT, status))
+            self._last_lcd_status = status
+
     def activate_servos(self):
         assert self._gpio_port is not None
-        self._lcd_topic.put(LcdMessage(MessageTopic.ABORT, MessageTopicStatus.ON))
-        GPIO.output(self._gpio_port, GPIO.LOW)
+        self._publish_lcd_status(MessageTopicStatus.ON)
+        self._gpio.output(self._gpio_port, self._gpio.LOW)
 
     def abort(self):
         assert self._gpio_port is not None
-        self._lcd_topic.put(LcdMessage(MessageTopic.ABORT, MessageTopicStatus.OFF))
-        GPIO.output(self._gpio_port, GPIO.HIGH)
+        self._publish_lcd_status(MessageTopicStatus.OFF)
+        self._gpio.output(self._gpio_port, self._gpio.HIGH)
         time.sleep(0.1)
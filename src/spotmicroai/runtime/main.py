@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import argparse
 import multiprocessing
 import sys
 from time import sleep
@@ -22,6 +21,23 @@ def process_controller(controller_class: type) -> None:
     controller.do_process_events_from_queues()
 
 
+def parse_telemetry_off(argv: list[str]) -> bool:
+    """Return whether --telemetry-off was passed.
+
+    The runtime starts from systemd on every boot, so the common cases are read
+    straight from argv. argparse is only imported for --help or unknown arguments,
+    where it prints usage or the error.
+    """
+    if all(arg == '--telemetry-off' for arg in argv):
+        return bool(argv)
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description='SpotmicroAI Runtime')
+    parser.add_argument('--telemetry-off', action='store_true', help='Disable telemetry controller')
+    return parser.parse_args(argv).telemetry_off
+
+
 def main(telemetry_enabled: bool = True):
     message_bus = MessageBus()
     log.info(labels.MAIN_MESSAGE_BUS_CREATED)
@@ -55,15 +71,13 @@ def main(telemetry_enabled: bool = True):
 
 
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='SpotmicroAI Runtime')
-    parser.add_argument('--telemetry-off', action='store_true', help='Disable telemetry controller')
-    args = parser.parse_args()
+    telemetry_off = parse_telemetry_off(sys.argv[1:])
 
     log.info(labels.MAIN_STARTING)
     abort_ctrl = AbortController()
 
     try:
-        main(telemetry_enabled=not args.telemetry_off)
+        main(telemetry_enabled=not telemetry_off)
 
     except KeyboardInterrupt:
         log.info(labels.MAIN_TERMINATED_CTRL_C)
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 import multiprocessing
 
 from spotmicroai.singleton import Singleton
@@ -22,11 +22,15 @@ class MessageTopicStatus(Enum):
     SEARCHING = "SEARCHING"
 
 
-class MessageAbortCommand(Enum):
-    """Enum for controller status values."""
+class MessageAbortCommand(IntEnum):
+    """Commands for the abort controller.
 
-    ACTIVATE = "activate"
-    ABORT = "abort"
+    Dense small integers: producers put ``.value`` on the abort queue so each event
+    pickles as a plain int instead of an enum reference.
+    """
+
+    ACTIVATE = 0
+    ABORT = 1
 
 
 class LcdMessage:
@@ -3,6 +3,37 @@ from spotmicroai.runtime.controller_event import ControllerEvent
 from .filtered_analog_axis import FilteredAnalogAxis
 from .debounced_button import DebouncedButton
 
+# One bit per digital button, used to detect edges for all buttons at once
+BUTTON_A = 1 << 0
+BUTTON_B = 1 << 1
+BUTTON_X = 1 << 2
+BUTTON_Y = 1 << 3
+BUTTON_LEFT_BUMPER = 1 << 4
+BUTTON_RIGHT_BUMPER = 1 << 5
+BUTTON_BACK = 1 << 6
+BUTTON_START = 1 << 7
+BUTTON_LEFT_STICK_CLICK = 1 << 8
+BUTTON_RIGHT_STICK_CLICK = 1 << 9
+
+# START toggles activation and is not treated as user activity
+_ACTIVITY_BUTTONS = (BUTTON_START - 1) | BUTTON_LEFT_STICK_CLICK | BUTTON_RIGHT_STICK_CLICK
+
+
+def pack_buttons(event: ControllerEvent) -> int:
+    """Pack the digital buttons of a ControllerEvent into a bitmask."""
+    return (
+        (BUTTON_A if event.a else 0)
+        | (BUTTON_B if event.b else 0)
+        | (BUTTON_X if event.x else 0)
+        | (BUTTON_Y if event.y else 0)
+        | (BUTTON_LEFT_BUMPER if event.left_bumper else 0)
+        | (BUTTON_RIGHT_BUMPER if event.right_bumper else 0)
+        | (BUTTON_BACK if event.back else 0)
+        | (BUTTON_START if event.start else 0)
+        | (BUTTON_LEFT_STICK_CLICK if event.left_stick_click else 0)
+        | (BUTTON_RIGHT_STICK_CLICK if event.right_stick_click else 0)
+    )
+
 
 class FilteredControllerEvent:
     """
@@ -37,6 +68,11 @@ class FilteredControllerEvent:
         self._left_stick_click = DebouncedButton()
         self._right_stick_click = DebouncedButton()
 
+        # Packed button state from the previous update and its rising edges
+        self._buttons = 0
+        self._rising = 0
+        self._buttons_stale = False
+
     # ----------------------------------------------------------------------
     def update(self, event: ControllerEvent) -> None:
         """
@@ -58,6 +94,16 @@ class FilteredControllerEvent:
         self._dpad_horizontal.update(event.dpad_horizontal)
         self._dpad_vertical.update(event.dpad_vertical)
 
+        # Rising edges for every button at once; when nothing changed and no
+        # press is pending from the previous update the debouncers are idle
+        buttons = pack_buttons(event)
+        rising = buttons & ~self._buttons
+        if not (buttons ^ self._buttons or self._rising or self._buttons_stale):
+            return
+        self._buttons = buttons
+        self._rising = rising
+        self._buttons_stale = False
+
         # Face buttons (digital)
         self._a.update(event.a)
         self._b.update(event.b)
@@ -105,6 +151,15 @@ class FilteredControllerEvent:
         self._left_stick_click.reset()
         self._right_stick_click.reset()
 
+        self._buttons = 0
+        self._rising = 0
+        self._buttons_stale = True
+
+    @property
+    def rising_buttons(self) -> int:
+        """Bitmask of buttons that went from released to pressed on the last update."""
+        return self._rising
+
     @property
     def left_stick_x(self):
         return self._left_stick_x.value
@@ -196,15 +251,7 @@ class FilteredControllerEvent:
             or abs(self.left_trigger) > threshold
             or self.dpad_horizontal != 0
             or self.dpad_vertical != 0
-            or self.a
-            or self.b
-            or self.x
-            or self.y
-            or self.left_bumper
-            or self.right_bumper
-            or self.back
-            or self.left_stick_click
-            or self.right_stick_click
+            or bool(self._rising & _ACTIVITY_BUTTONS)
         )
 
     @property
@@ -10,12 +10,33 @@ from spotmicroai.hardware.servo.servo_service import ServoService
 from spotmicroai.logger import Logger
 from spotmicroai.runtime.controller_event import ControllerEvent
 from spotmicroai.runtime.messaging import LcdMessage, MessageAbortCommand, MessageBus, MessageTopic, MessageTopicStatus
-from spotmicroai.runtime.motion_controller.filtered_controller_event import FilteredControllerEvent
+from spotmicroai.runtime.motion_controller.filtered_controller_event import (
+    BUTTON_A,
+    BUTTON_B,
+    BUTTON_BACK,
+    BUTTON_LEFT_BUMPER,
+    BUTTON_LEFT_STICK_CLICK,
+    BUTTON_RIGHT_BUMPER,
+    BUTTON_RIGHT_STICK_CLICK,
+    BUTTON_START,
+    BUTTON_X,
+    BUTTON_Y,
+    FilteredControllerEvent,
+)
 from spotmicroai.runtime.motion_controller.services import KeyframeService, PoseService, TelemetryService
+from spotmicroai.runtime.realtime import enable_fifo
 from spotmicroai.singleton import Singleton
 
 log = Logger().setup_logger('Motion controller')
 
+# Analog body moves map the stick value (-1..1) continuously onto fixed angle ranges.
+# Ranges are stored as (start, span) so each move is one multiply-add per joint.
+_ANALOG_INPUT_MIN = -1.0
+_ANALOG_INPUT_SPAN = 2.0
+_SHOULDER_START, _SHOULDER_SPAN = 35, 110  # 35 -> 145
+_HEIGHT_LEG_START, _HEIGHT_LEG_SPAN = 180, -160  # 180 -> 20
+_HEIGHT_FOOT_START, _HEIGHT_FOOT_SPAN = 130, 40  # 130 -> 170
+
 
 class MotionController(metaclass=Singleton):
     """
@@ -29,6 +50,7 @@ class MotionController(metaclass=Singleton):
 
     _is_activated = False
     _is_running = False
+    _settle_until = 0.0
     _keyframe_service: KeyframeService
     _telemetry_service: TelemetryService
 
@@ -81,7 +103,7 @@ class MotionController(metaclass=Singleton):
 
         self._servo_service.deactivate_servos()
 
-        self._abort_topic.put(MessageAbortCommand.ABORT)
+        self._abort_topic.put(MessageAbortCommand.ABORT.value)
         self._is_activated = False
         log.info(labels.MOTION_TERMINATED)
         sys.exit(0)
@@ -92,12 +114,31 @@ class MotionController(metaclass=Singleton):
         manages activation states, and updates telemetry.
         """
 
+        enable_fifo(constants.MOTION_FIFO_PRIORITY)
+
         # State Variables
         inactivity_counter = time.time()
 
         raw_event: ControllerEvent | None = None
         self._filtered_controller_event = FilteredControllerEvent()
 
+        # Bind hot-path attributes to locals once; the loop runs at FRAME_RATE_HZ
+        filtered_event = self._filtered_controller_event
+        servo_service = self._servo_service
+        keyframe_service = self._keyframe_service
+        pose_service = self._pose_service
+        telemetry_publish = self._telemetry_service.publish
+        motion_get = self._motion_topic.get
+        queue_empty = queue.Empty
+        frame_duration = constants.FRAME_DURATION
+        frame_duration_ns = constants.FRAME_DURATION_NS
+        inactivity_time = constants.INACTIVITY_TIME
+        body_move_deadzone = constants.BODY_MOVE_DEADZONE
+        now = time.time
+        monotonic = time.monotonic
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+
         # Telemetry variables
         cycle_index = None
         cycle_ratio = None
@@ -106,176 +147,204 @@ class MotionController(metaclass=Singleton):
         iteration_window_start = time.time()
         iteration_time_accumulator = 0.0
         iteration_samples = 0
+        queue_high_water = 1
 
-        while True:
-            frame_start = time.time()
+        # Absolute deadline of the current frame. Advancing it by a whole frame each
+        # iteration absorbs sleep overshoot instead of letting it accumulate.
+        next_deadline_ns = monotonic_ns()
 
-            try:
-                raw_event = self._motion_topic.get(block=False)
-            except queue.Empty:
-                raw_event = None
+        while True:
+            frame_start = now()
+            next_deadline_ns += frame_duration_ns
+
+            # Drain the motion queue so bursts collapse to the most recent event
+            raw_event = None
+            drained = 0
+            while True:
+                try:
+                    raw_event = motion_get(block=False)
+                except queue_empty:
+                    break
+                drained += 1
+
+            if drained > queue_high_water:
+                queue_high_water = drained
+                log.debug(labels.MOTION_QUEUE_HIGH_WATER.format(queue_high_water))
 
             # Filter the raw event through debouncing and smoothing
             if raw_event is not None:
-                self._filtered_controller_event.update(raw_event)
+                filtered_event.update(raw_event)
+
+            # Rising edges of all digital buttons as a single bitmask
+            rising = filtered_event.rising_buttons
+            if monotonic() < self._settle_until:
+                # Ignore button edges while servos settle; the loop keeps its cadence. START
+                # is exempt: its edge is already consumed, so masking it would drop the press.
+                rising &= BUTTON_START
 
             # Handle START button with debouncing
-            if self._filtered_controller_event.start:
+            if rising & BUTTON_START:
                 inactivity_counter = self._handle_start_button_toggle(inactivity_counter)
 
-            if not self._is_activated:
-                time.sleep(0.1)
-                continue
-
-            # Get filtered event reference for cleaner code
-            filtered_event = self._filtered_controller_event
-
-            # Check if there's any user input activity
-            has_input = filtered_event.has_activity()
-
-            if not has_input:
-                # if there is no user input, check to see if it have been long enough to warn the user
-                if (time.time() - inactivity_counter) >= constants.INACTIVITY_TIME:
-                    log.info(labels.MOTION_INACTIVITY_WARNING.format(constants.INACTIVITY_TIME))
-                    log.info(labels.MOTION_SHUTDOWN_SERVOS)
-                    log.info(labels.MOTION_PRESS_START_ENABLE)
-                    self._deactivate()
-
-                # throttle CPU when no input but still activated
-                time.sleep(0.05)
-                continue
-
-            else:
-                # If there activity, reset the timer
-                inactivity_counter = time.time()
-
-            try:
-                if self._is_running:
-                    # Update walking cycle and get current position
-                    self._update_servo_angles()
-                else:
-                    # When not running, clear the telemetry values
-                    cycle_index = None
-                    cycle_ratio = None
-                    leg_positions = None
-
-                if filtered_event.a:
-                    self._is_running = False
-                    self._servo_service.rest_position()
-
-                # Handle cases when robot is running
-                if self._is_running:
-                    # Right Trigger
-                    # if filtered_event.right_trigger:
-                    # Left Trigger
-                    # if filtered_event.left_trigger:
-
-                    if filtered_event.y:
-                        pass
-
-                    if filtered_event.b:
-                        pass
-
-                    if filtered_event.x:
-                        pass
-
-                    # D-Pad Left/Right
-                    if filtered_event.dpad_horizontal != 0:
-                        pass
-                    # D-Pad Up/Down
-                    if filtered_event.dpad_vertical != 0:
-                        if filtered_event.dpad_vertical > 0:
-                            self._keyframe_service.adjust_walking_speed(-1)
-                        else:
-                            self._keyframe_service.adjust_walking_speed(1)
-
-                    # Left Thumbstick Up/Down
-                    if filtered_event.left_stick_y != 0:
-                        self._keyframe_service.set_forward_factor(filtered_event.left_stick_y)
-
-                    # Left Thumbstick Left/Right
-                    if filtered_event.left_stick_x != 0:
-                        self._keyframe_service.set_rotation_factor(filtered_event.left_stick_x)
-
-                    # Left Thumbstick Click
-                    if filtered_event.left_stick_click:
-                        self._keyframe_service.reset_movement()
-
-                    # Right Thumbstick Up/Down
-                    if filtered_event.right_stick_y != 0:
-                        self._keyframe_service.set_lean(filtered_event.right_stick_y)
-                    # Right Thumbstick Left/Right
-                    if filtered_event.right_stick_x != 0:
-                        self._keyframe_service.set_height_offset(filtered_event.right_stick_x)
-                    # Right Thumbstick Click
-                    if filtered_event.right_stick_click:
-                        self._keyframe_service.reset_body_adjustments()
+            # Frames without work still fall through to the frame pacing below
+            # instead of spinning on their own sleep
+            skip_logic = True
+            has_input = False
+
+            if self._is_activated:
+                # Check if there's any user input activity
+                has_input = filtered_event.has_activity()
+
+                if not has_input:
+                    # The sticks are centered, so the next pitch move starts without stale smoothing
+                    self.prev_pitch_analog = None
+                    # if there is no user input, check to see if it have been long enough to warn the user
+                    if (now() - inactivity_counter) >= inactivity_time:
+                        log.info(labels.MOTION_INACTIVITY_WARNING.format(inactivity_time))
+                        log.info(labels.MOTION_SHUTDOWN_SERVOS)
+                        log.info(labels.MOTION_PRESS_START_ENABLE)
+                        self._deactivate()
                 else:
-                    # Right Bumper
-                    if filtered_event.right_bumper:
-                        # Next Pose
-                        time.sleep(0.5)
-                        next_pose = self._pose_service.next()
-                        self._servo_service.set_pose(next_pose)
-                    # Left Bumper
-                    if filtered_event.left_bumper:
-                        # Prev Pose
-                        time.sleep(0.5)
-                        prev_pose = self._pose_service.previous()
-                        self._servo_service.set_pose(prev_pose)
-
-                    if filtered_event.dpad_vertical != 0:
-                        self.body_move_pitch(filtered_event.dpad_vertical)
-
-                    if filtered_event.dpad_horizontal != 0:
-                        self.body_move_roll(filtered_event.dpad_horizontal)
-
-                    if filtered_event.left_stick_y != 0:
-                        self.body_move_pitch_analog(filtered_event.left_stick_y)
-
-                    if filtered_event.left_stick_x != 0:
-                        self.body_move_roll_analog(filtered_event.left_stick_x)
-
-                    if filtered_event.right_stick_y != 0:
-                        self.body_move_yaw_analog(filtered_event.right_stick_y)
-
-                    if filtered_event.right_stick_x != 0:
-                        self.body_move_height_analog(filtered_event.right_stick_x)
-
-                    # if filtered_event.y:
-                    #     self.standing_position()
-
-                    # if filtered_event.b:
-                    #     self.handle_instinct(self._instincts['pushUp'])
-
-                    # if filtered_event.x:
-                    #     self.handle_instinct(self._instincts['sit'])
-
-                    # if filtered_event.y:
-                    #     self.handle_instinct(self._instincts['sleep'])
-
-                # Handle BACK button (walking toggle) with debouncing
-                if filtered_event.back:
-                    self._is_running = not self._is_running
+                    # If there activity, reset the timer
+                    inactivity_counter = now()
+                    skip_logic = False
+
+            if not skip_logic:
+                # Read each filtered axis once per frame
+                dpad_horizontal = filtered_event.dpad_horizontal
+                dpad_vertical = filtered_event.dpad_vertical
+                left_stick_x = filtered_event.left_stick_x
+                left_stick_y = filtered_event.left_stick_y
+                right_stick_x = filtered_event.right_stick_x
+                right_stick_y = filtered_event.right_stick_y
+
+                try:
                     if self._is_running:
-                        # Reset walking state when starting to walk
-                        self._keyframe_service.reset_walking_state()
-                    time.sleep(0.5)
-
-                self._servo_service.commit()
-
-            finally:
-                # continue
-                pass
+                        # Update walking cycle and get current position
+                        self._update_servo_angles()
+                    else:
+                        # When not running, clear the telemetry values
+                        cycle_index = None
+                        cycle_ratio = None
+                        leg_positions = None
+
+                    if rising & BUTTON_A:
+                        self._is_running = False
+                        servo_service.rest_position()
+
+                    # Handle cases when robot is running
+                    if self._is_running:
+                        # Right Trigger
+                        # if filtered_event.right_trigger:
+                        # Left Trigger
+                        # if filtered_event.left_trigger:
+
+                        if rising & BUTTON_Y:
+                            pass
+
+                        if rising & BUTTON_B:
+                            pass
+
+                        if rising & BUTTON_X:
+                            pass
+
+                        # D-Pad Left/Right
+                        if dpad_horizontal != 0:
+                            pass
+                        # D-Pad Up/Down
+                        if dpad_vertical != 0:
+                            if dpad_vertical > 0:
+                                keyframe_service.adjust_walking_speed(-1)
+                            else:
+                                keyframe_service.adjust_walking_speed(1)
+
+                        # Left Thumbstick Up/Down
+                        if left_stick_y != 0:
+                            keyframe_service.set_forward_factor(left_stick_y)
+
+                        # Left Thumbstick Left/Right
+                        if left_stick_x != 0:
+                            keyframe_service.set_rotation_factor(left_stick_x)
+
+                        # Left Thumbstick Click
+                        if rising & BUTTON_LEFT_STICK_CLICK:
+                            keyframe_service.reset_movement()
+
+                        # Right Thumbstick Up/Down
+                        if right_stick_y != 0:
+                            keyframe_service.set_lean(right_stick_y)
+                        # Right Thumbstick Left/Right
+                        if right_stick_x != 0:
+                            keyframe_service.set_height_offset(right_stick_x)
+                        # Right Thumbstick Click
+                        if rising & BUTTON_RIGHT_STICK_CLICK:
+                            keyframe_service.reset_body_adjustments()
+                    else:
+                        # Right Bumper
+                        if rising & BUTTON_RIGHT_BUMPER:
+                            # Next Pose
+                            self._settle_until = monotonic() + constants.BUTTON_SETTLE_TIME
+                            next_pose = pose_service.next()
+                            servo_service.set_pose(next_pose)
+                        # Left Bumper
+                        if rising & BUTTON_LEFT_BUMPER:
+                            # Prev Pose
+                            self._settle_until = monotonic() + constants.BUTTON_SETTLE_TIME
+                            prev_pose = pose_service.previous()
+                            servo_service.set_pose(prev_pose)
+
+                        if dpad_vertical != 0:
+                            self.body_move_pitch(dpad_vertical)
+
+                        if dpad_horizontal != 0:
+                            self.body_move_roll(dpad_horizontal)
+
+                        # Called on every body-move frame so the pitch smoothing sees the stick return to center
+                        self.body_move_pitch_analog(left_stick_y)
+
+                        if abs(left_stick_x) > body_move_deadzone:
+                            self.body_move_roll_analog(left_stick_x)
+
+                        if abs(right_stick_y) > body_move_deadzone:
+                            self.body_move_yaw_analog(right_stick_y)
+
+                        if abs(right_stick_x) > body_move_deadzone:
+                            self.body_move_height_analog(right_stick_x)
+
+                        # if filtered_event.y:
+                        #     self.standing_position()
+
+                        # if filtered_event.b:
+                        #     self.handle_instinct(self._instincts['pushUp'])
+
+                        # if filtered_event.x:
+                        #     self.handle_instinct(self._instincts['sit'])
+
+                        # if filtered_event.y:
+                        #     self.handle_instinct(self._instincts['sleep'])
+
+                    # Handle BACK button (walking toggle) with debouncing
+                    if rising & BUTTON_BACK:
+                        self._is_running = not self._is_running
+                        if self._is_running:
+                            # Reset walking state when starting to walk
+                            keyframe_service.reset_walking_state()
+                        self._settle_until = monotonic() + constants.BUTTON_SETTLE_TIME
+
+                    servo_service.commit()
+
+                finally:
+                    # continue
+                    pass
 
             # Calculate timing metrics
-            elapsed_time = time.time() - frame_start
-            idle_time = max(constants.FRAME_DURATION - elapsed_time, 0)
+            elapsed_time = now() - frame_start
+            idle_time = max(frame_duration - elapsed_time, 0)
             loop_time_ms = elapsed_time * 1000
             idle_time_ms = idle_time * 1000
 
             # Publish telemetry (service handles throttling and queue stats internally)
-            self._telemetry_service.publish(
+            telemetry_publish(
                 event=filtered_event.value if has_input else None,
                 loop_time_ms=loop_time_ms,
                 idle_time_ms=idle_time_ms,
@@ -284,10 +353,14 @@ class MotionController(metaclass=Singleton):
                 leg_positions=leg_positions,
             )
 
-            if elapsed_time < constants.FRAME_DURATION:
-                time.sleep(constants.FRAME_DURATION - elapsed_time)
+            remaining_ns = next_deadline_ns - monotonic_ns()
+            if remaining_ns > 0:
+                sleep(remaining_ns / 1e9)
+            elif remaining_ns < -frame_duration_ns:
+                # Overran by more than a frame: resynchronise rather than bursting to catch up
+                next_deadline_ns = monotonic_ns()
 
-            iteration_end = time.time()
+            iteration_end = now()
             iteration_duration = iteration_end - frame_start
             iteration_time_accumulator += iteration_duration
             iteration_samples += 1
@@ -333,7 +406,7 @@ class MotionController(metaclass=Singleton):
             pose.rear_right.foot_angle, pose.rear_right.leg_angle, pose.rear_right.shoulder_angle
         )
 
-    def body_move_pitch(self, raw_value: float):
+    def body_move_pitch(self, raw_value: float, _copysign=math.copysign):
         """
         Adjusts the robot's body pitch based on input value.
 
@@ -357,7 +430,7 @@ class MotionController(metaclass=Singleton):
             return
 
         # --- Optional exponential response for fine control near center ---
-        scaled = math.copysign(abs(smoothed_value) ** 1.5, smoothed_value)
+        scaled = _copysign(abs(smoothed_value) ** 1.5, smoothed_value)
 
         # --- Scale increments ---
         leg_increment = 10 * scaled
@@ -372,6 +445,7 @@ class MotionController(metaclass=Singleton):
         self._servo_service.front_foot_left_angle -= foot_increment
         self._servo_service.front_leg_right_angle -= leg_increment
         self._servo_service.front_foot_right_angle += foot_increment
+        self._servo_service.clamp_staged()
 
     def body_move_roll(self, raw_value: float):
         """
@@ -384,32 +458,18 @@ class MotionController(metaclass=Singleton):
         increment = 1
 
         if raw_value < 0:
-            self._servo_service.rear_shoulder_left_angle = max(
-                self._servo_service.rear_shoulder_left_angle - increment, 0
-            )
-            self._servo_service.rear_shoulder_right_angle = max(
-                self._servo_service.rear_shoulder_right_angle - increment, 0
-            )
-            self._servo_service.front_shoulder_left_angle = min(
-                self._servo_service.front_shoulder_left_angle + increment, 180
-            )
-            self._servo_service.front_shoulder_right_angle = min(
-                self._servo_service.front_shoulder_right_angle + increment, 180
-            )
+            self._servo_service.rear_shoulder_left_angle -= increment
+            self._servo_service.rear_shoulder_right_angle -= increment
+            self._servo_service.front_shoulder_left_angle += increment
+            self._servo_service.front_shoulder_right_angle += increment
+            self._servo_service.clamp_staged()
 
         elif raw_value > 0:
-            self._servo_service.rear_shoulder_left_angle = min(
-                self._servo_service.rear_shoulder_left_angle + increment, 180
-            )
-            self._servo_service.rear_shoulder_right_angle = min(
-                self._servo_service.rear_shoulder_right_angle + increment, 180
-            )
-            self._servo_service.front_shoulder_left_angle = max(
-                self._servo_service.front_shoulder_left_angle - increment, 0
-            )
-            self._servo_service.front_shoulder_right_angle = max(
-                self._servo_service.front_shoulder_right_angle - increment, 0
-            )
+            self._servo_service.rear_shoulder_left_angle += increment
+            self._servo_service.rear_shoulder_right_angle += increment
+            self._servo_service.front_shoulder_left_angle -= increment
+            self._servo_service.front_shoulder_right_angle -= increment
+            self._servo_service.clamp_staged()
 
         else:
             self._servo_service.rest_position()
@@ -490,7 +550,7 @@ class MotionController(metaclass=Singleton):
     #     self.servos_configurations.front_right.leg.rest_angle = self.servos_configurations.front_right.leg.rest_angle + variation_leg - 5
     #     self.servos_configurations.front_right.foot.rest_angle = self.servos_configurations.front_right.foot.rest_angle - variation_feet + 5
 
-    def body_move_pitch_analog(self, raw_value: float):
+    def body_move_pitch_analog(self, raw_value: float, _copysign=math.copysign):
         """
         Smoothly adjusts the robot's body pitch based on analog input,
         without forcing servos back to center when the stick returns to zero.
@@ -508,6 +568,12 @@ class MotionController(metaclass=Singleton):
             "foot": (-5, 5),  # Symmetric: ±5 degrees
         }
 
+        # --- Apply deadzone to the stick; the next move then starts fresh instead of
+        # from the last off-center smoothed value ---
+        if abs(raw_value) <= constants.BODY_MOVE_DEADZONE:
+            self.prev_pitch_analog = None
+            return
+
         # --- Initialize previous value on first call to avoid startup jerk ---
         prev = getattr(self, "prev_pitch_analog", None)
         if prev is None:
@@ -518,8 +584,12 @@ class MotionController(metaclass=Singleton):
         smoothed_value = prev + ALPHA * (raw_value - prev)
         self.prev_pitch_analog = smoothed_value
 
+        # --- Apply deadzone to the smoothed value, which lags the stick ---
+        if abs(smoothed_value) < constants.BODY_MOVE_DEADZONE:
+            return
+
         # --- Nonlinear response (for softer control near center) ---
-        curved = math.copysign(abs(smoothed_value) ** RESPONSE_CURVE, smoothed_value)
+        curved = _copysign(abs(smoothed_value) ** RESPONSE_CURVE, smoothed_value)
 
         # --- Scale to motion range (-INPUT_SCALE to +INPUT_SCALE) ---
         mapped_input = curved * INPUT_SCALE
@@ -540,6 +610,7 @@ class MotionController(metaclass=Singleton):
 
         self._servo_service.rear_leg_right_angle += leg_delta
         self._servo_service.rear_foot_right_angle += foot_delta
+        self._servo_service.clamp_staged()
 
     def body_move_roll_analog(self, raw_value):
         """
@@ -548,14 +619,17 @@ class MotionController(metaclass=Singleton):
         Args:
             raw_value: The raw analog input value for roll adjustment.
         """
-        raw_value = math.floor(raw_value * 10 / 2)
+        ratio = (raw_value - _ANALOG_INPUT_MIN) / _ANALOG_INPUT_SPAN
+        opening = int(_SHOULDER_START + ratio * _SHOULDER_SPAN)
+        closing = int(_SHOULDER_START + _SHOULDER_SPAN - ratio * _SHOULDER_SPAN)
 
         # Roll: left and right shoulders move opposite
-        self._servo_service.front_shoulder_left_angle = int(self.maprange((-5, 5), (145, 35), raw_value))
-        self._servo_service.rear_shoulder_left_angle = int(self.maprange((-5, 5), (145, 35), raw_value))
+        servo_service = self._servo_service
+        servo_service.front_shoulder_left_angle = closing
+        servo_service.rear_shoulder_left_angle = closing
 
-        self._servo_service.front_shoulder_right_angle = int(self.maprange((-5, 5), (35, 145), raw_value))
-        self._servo_service.rear_shoulder_right_angle = int(self.maprange((-5, 5), (35, 145), raw_value))
+        servo_service.front_shoulder_right_angle = opening
+        servo_service.rear_shoulder_right_angle = opening
 
     def body_move_height_analog(self, raw_value):
         """
@@ -564,20 +638,21 @@ class MotionController(metaclass=Singleton):
         Args:
             raw_value: The raw analog input value for height adjustment.
         """
-
-        raw_value = math.floor(raw_value * 10 / 2)
+        ratio = (raw_value - _ANALOG_INPUT_MIN) / _ANALOG_INPUT_SPAN
+        leg_angle = int(_HEIGHT_LEG_START + ratio * _HEIGHT_LEG_SPAN)
+        foot_angle = int(_HEIGHT_FOOT_START + ratio * _HEIGHT_FOOT_SPAN)
 
         # Raise/lower body equally on all legs
-        for name in ["front_leg_left_angle", "rear_leg_left_angle", "front_leg_right_angle", "rear_leg_right_angle"]:
-            setattr(self._servo_service, name, int(self.maprange((-5, 5), (180, 20), raw_value)))
+        servo_service = self._servo_service
+        servo_service.front_leg_left_angle = leg_angle
+        servo_service.rear_leg_left_angle = leg_angle
+        servo_service.front_leg_right_angle = leg_angle
+        servo_service.rear_leg_right_angle = leg_angle
 
-        for name in [
-            "front_foot_left_angle",
-            "rear_foot_left_angle",
-            "front_foot_right_angle",
-            "rear_foot_right_angle",
-        ]:
-            setattr(self._servo_service, name, int(self.maprange((-5, 5), (130, 170), raw_value)))
+        servo_service.front_foot_left_angle = foot_angle
+        servo_service.rear_foot_left_angle = foot_angle
+        servo_service.front_foot_right_angle = foot_angle
+        servo_service.rear_foot_right_angle = foot_angle
 
     def body_move_yaw_analog(self, raw_value):
         """
@@ -586,14 +661,17 @@ class MotionController(metaclass=Singleton):
         Args:
             raw_value: The raw analog input value for yaw adjustment.
         """
-        raw_value = math.floor(raw_value * 10 / 2)
+        ratio = (raw_value - _ANALOG_INPUT_MIN) / _ANALOG_INPUT_SPAN
+        opening = int(_SHOULDER_START + ratio * _SHOULDER_SPAN)
+        closing = int(_SHOULDER_START + _SHOULDER_SPAN - ratio * _SHOULDER_SPAN)
 
         # Yaw: diagonal shoulders move opposite
-        self._servo_service.front_shoulder_left_angle = int(self.maprange((-5, 5), (35, 145), raw_value))
-        self._servo_service.rear_shoulder_right_angle = int(self.maprange((-5, 5), (35, 145), raw_value))
+        servo_service = self._servo_service
+        servo_service.front_shoulder_left_angle = opening
+        servo_service.rear_shoulder_right_angle = opening
 
-        self._servo_service.front_shoulder_right_angle = int(self.maprange((-5, 5), (145, 35), raw_value))
-        self._servo_service.rear_shoulder_left_angle = int(self.maprange((-5, 5), (145, 35), raw_value))
+        servo_service.front_shoulder_right_angle = closing
+        servo_service.rear_shoulder_left_angle = closing
 
     def _deactivate(self):
         """
@@ -602,9 +680,10 @@ class MotionController(metaclass=Singleton):
         self._is_activated = False
         self._is_running = False
         self._servo_service.rest_position()
-        time.sleep(0.25)
+        # Servos must physically reach rest before the board is powered down
+        time.sleep(constants.SERVO_SETTLE_TIME)
         self._servo_service.deactivate_servos()
-        self._abort_topic.put(MessageAbortCommand.ABORT)
+        self._abort_topic.put(MessageAbortCommand.ABORT.value)
 
     def _activate(self):
         """
@@ -615,10 +694,10 @@ class MotionController(metaclass=Singleton):
         """
         log.info(labels.MOTION_REACTIVATE_SERVOS)
         self._is_activated = True
-        self._abort_topic.put(MessageAbortCommand.ACTIVATE)
+        self._abort_topic.put(MessageAbortCommand.ACTIVATE.value)
         self._servo_service.activate_servos()
-        time.sleep(0.25)
         self._servo_service.rest_position()
+        self._settle_until = time.monotonic() + constants.SERVO_SETTLE_TIME
         # Reset inactivity counter on activation so timer starts now
         return time.time()
 
@@ -0,0 +1,38 @@
+"""
+Real-time scheduling helpers for the runtime controller processes.
+"""
+
+import os
+
+from spotmicroai import labels
+from spotmicroai.logger import Logger
+
+log = Logger().setup_logger('Realtime')
+
+
+def enable_fifo(priority: int) -> bool:
+    """
+    Switch the calling process to the SCHED_FIFO real-time policy.
+
+    Needs CAP_SYS_NICE or an RLIMIT_RTPRIO of at least ``priority`` (``ulimit -r``,
+    ``LimitRTPRIO=`` in the systemd unit). Without either the process keeps its
+    normal scheduling and a warning is logged.
+
+    Args:
+        priority: SCHED_FIFO priority, 1 (lowest) to 99 (highest).
+
+    Returns:
+        True if the policy was applied.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+    except (AttributeError, OSError) as e:
+        log.warning(labels.REALTIME_FIFO_UNAVAILABLE.format(priority, e))
+        return False
+    log.info(labels.REALTIME_FIFO_ENABLED.format(priority))
+    return True
+
+
+__all__ = [
+    'enable_fifo',
+]
@@ -4,7 +4,7 @@ import time
 
 from spotmicroai import labels
 from spotmicroai.configuration._config_provider import ConfigProvider
-from spotmicroai.constants import DEVICE_SEARCH_INTERVAL, PUBLISH_RATE_HZ, READ_LOOP_SLEEP
+from spotmicroai.constants import DEVICE_SEARCH_INTERVAL, PUBLISH_PERIOD_NS, READ_LOOP_SLEEP
 from spotmicroai.logger import Logger
 from spotmicroai.runtime.messaging import LcdMessage, MessageAbortCommand, MessageBus, MessageTopic, MessageTopicStatus
 from spotmicroai.singleton import Singleton
@@ -51,7 +51,7 @@ class RemoteControllerController(metaclass=Singleton):
 
     def _notify_searching_for_device(self) -> None:
         """Notify about device search and abort current motion."""
-        self._abort_topic.put(MessageAbortCommand.ABORT)
+        self._abort_topic.put(MessageAbortCommand.ABORT.value)
         self._lcd_topic.put(LcdMessage(MessageTopic.REMOTE, MessageTopicStatus.SEARCHING))
 
     def do_process_events_from_queues(self):
@@ -73,7 +73,7 @@ class RemoteControllerController(metaclass=Singleton):
                 remote_controller_connected_already = False
                 continue
 
-            next_publish_time = time.time() + 1.0 / PUBLISH_RATE_HZ
+            next_publish_ns = time.monotonic_ns() + PUBLISH_PERIOD_NS
 
             # Main event loop
             while True:
@@ -81,8 +81,7 @@ class RemoteControllerController(metaclass=Singleton):
                     # Poll joystick events (~100 Hz)
                     self._remote_control_service.poll_events()
 
-                    now = time.time()
-                    if now >= next_publish_time:
+                    if time.monotonic_ns() >= next_publish_ns:
                         # Publish the aggregated state
                         current_state = self._remote_control_service.controller_event()
                         self._motion_topic.put(current_state)
@@ -91,7 +90,7 @@ class RemoteControllerController(metaclass=Singleton):
                         self._remote_control_service.clear()
 
                         # Schedule next publish tick (avoids drift)
-                        next_publish_time += 1.0 / PUBLISH_RATE_HZ
+                        next_publish_ns += PUBLISH_PERIOD_NS
 
                     # Sleep briefly to limit CPU usage
                     time.sleep(READ_LOOP_SLEEP)
@@ -106,7 +105,7 @@ class RemoteControllerController(metaclass=Singleton):
                 except Exception as e:
                     # Unexpected fatal exception: log and abort system
                     log.error(labels.REMOTE_QUEUE_ERROR.format(e))
-                    self._abort_topic.put(MessageAbortCommand.ABORT)
+                    self._abort_topic.put(MessageAbortCommand.ABORT.value)
                     self._remote_control_service.disconnect()
                     remote_controller_connected_already = False
                     break
@@ -2,7 +2,7 @@
 Reusable Singleton metaclass.
 """
 
-from typing import Any, Dict
+import threading
 
 
 class Singleton(type):
@@ -10,12 +10,20 @@ class Singleton(type):
     Metaclass that enforces single-instance creation for subclasses.
     """
 
-    _instances: Dict[type, Any] = {}
+    _instances: dict[type, object] = {}
+    # Reentrant because singletons create other singletons in their __init__
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # Fast path: a single dict lookup once the instance exists
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
 
 
 __all__ = [
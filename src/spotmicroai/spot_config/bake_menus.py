@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Bake the ConfigApp menu definitions into a Python module.
+
+Run after editing or deploying the menu JSON files:
+
+    python -m spotmicroai.spot_config.bake_menus
+
+The connect tool runs it on the Raspberry Pi after every setup and code sync.
+
+The generated ``menus_baked.py`` holds the merged menus as a Python literal
+together with the key of the JSON files it was built from. ``load_menus`` imports
+it when the key still matches, so startup loads compiled bytecode instead of
+parsing JSON. When the JSON files change the baked module is ignored until it
+is regenerated.
+"""
+
+from pathlib import Path
+import pprint
+
+from spotmicroai.spot_config.spot_config import MENUS_DIR, _menu_cache_key, _scan_menu_files, load_menus
+
+BAKED_MODULE = Path(__file__).resolve().parent / "menus_baked.py"
+
+
+def bake_menus(base_dir: Path = MENUS_DIR, output: Path = BAKED_MODULE) -> None:
+    """
+    Write the merged menus from base_dir into a Python module.
+
+    Args:
+        base_dir (Path): Directory containing menu files.
+        output (Path): Path of the module to generate.
+    """
+    json_files = _scan_menu_files(base_dir)
+    menus = dict(load_menus(base_dir))
+
+    output.write_text(
+        '"""Menu definitions generated by bake_menus.py. Do not edit."""\n\n'
+        f"SOURCE_KEY = {_menu_cache_key(json_files)!r}\n\n"
+        f"MENUS = {pprint.pformat(menus, sort_dicts=False, width=120)}\n",
+        encoding="utf-8",
+    )
+    print(f"[INFO] Baked {len(menus)} menus into {output}")
+
+
+if __name__ == "__main__":
+    bake_menus()
@@ -1,11 +1,16 @@
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from spotmicroai.hardware.servo import JointType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CalibrationPoint:
-    """Represents a calibration point with angle and pulse width."""
+    """Represents a calibration point with angle and pulse width.
+
+    The module-level specs below are shared, so captures are recorded on a copy
+    made with ``dataclasses.replace`` rather than by mutating the spec.
+    """
 
     description: str
     physical_angle: float  # The actual angle in degrees IRL
@@ -13,31 +18,33 @@ class CalibrationPoint:
 
 
 # Foot calibration: Maps physical angles to servo pulse widths
-FOOT_CALIBRATION_POINTS = [
+FOOT_CALIBRATION_POINTS = (
     CalibrationPoint("Minimum position (foot inline with leg)", 17),
     CalibrationPoint("Maximum position (foot perpendicular to leg)", 131),
-]
+)
 
 # Leg calibration: Maps physical angles to servo pulse widths
 # Calibrate at two easily measurable reference points (90° and 0°)
 # and infer the target range through linear extrapolation
-LEG_CALIBRATION_POINTS = [
+LEG_CALIBRATION_POINTS = (
     CalibrationPoint("Reference position 1 (leg horizontal, 90°)", 90),
     CalibrationPoint("Reference position 2 (leg vertical, 0°)", 0),
-]
+)
 
 # Shoulder calibration: Maps physical angles to servo pulse widths
 # Calibrate at two easily measurable reference points (90° and 180°)
 # and infer the target range [60°-120°] through linear extrapolation
 # Rest position is at 90° (the first reference point)
-SHOULDER_CALIBRATION_POINTS = [
+SHOULDER_CALIBRATION_POINTS = (
     CalibrationPoint("Reference position 1 (shoulder at 90°, also the rest position)", 90),
     CalibrationPoint("Reference position 2 (shoulder at 180°)", 180),
-]
+)
 
 # Mapping of joint types to their calibration specifications
-CALIBRATION_POINTS = {
-    JointType.SHOULDER: SHOULDER_CALIBRATION_POINTS,
-    JointType.LEG: LEG_CALIBRATION_POINTS,
-    JointType.FOOT: FOOT_CALIBRATION_POINTS,
-}
+CALIBRATION_POINTS = MappingProxyType(
+    {
+        JointType.SHOULDER: SHOULDER_CALIBRATION_POINTS,
+        JointType.LEG: LEG_CALIBRATION_POINTS,
+        JointType.FOOT: FOOT_CALIBRATION_POINTS,
+    }
+)
@@ -10,6 +10,8 @@ Usage: calibration_wizard.py <SERVO_ID>
 """
 
 import curses
+from dataclasses import replace
+import signal
 import sys
 from typing import Tuple
 
@@ -29,6 +31,13 @@ from spotmicroai.hardware.servo._servo import Servo
 from spotmicroai.hardware.servo._servo_factory import ServoFactory
 from spotmicroai.spot_config.ui import theme as THEME, ui_utils
 
+# Columns available for text inside a popup: from column 3 up to the right border
+_POPUP_TEXT_WIDTH = POPUP_WIDTH - 4
+
+# Servo names keyed by the IDs accepted on the command line
+_SERVO_NAMES_BY_ID = {servo_name.value: servo_name for servo_name in ServoName}
+_VALID_SERVO_IDS_MSG = LABELS.WIZARD_VALID_SERVO_IDS.format(', '.join(_SERVO_NAMES_BY_ID))
+
 
 class CalibrationWizard:
     """Interactive wizard for step-by-step servo calibration."""
@@ -48,252 +57,286 @@ class CalibrationWizard:
         self.captured_points: list[CalibrationPoint] = []
         self.popup_start_y = 0
         self.popup_start_x = 0
+        # Terminal (height, width), refreshed when a popup is created and on KEY_RESIZE
+        self._screen_size = stdscr.getmaxyx()
         self.formatted_servo_name = servo_enum.value.replace(LABELS.UNDERSCORE_CHAR, LABELS.SPACE_CHAR).title()
         # Get joint type and calibration spec
         self.joint_type = JointType.from_servo_name(servo_enum)
         self.points = CALIBRATION_POINTS[self.joint_type]
+        # Popup shared by every wizard step, created on first use
+        self._popup: curses.window | None = None
 
     def get_popup_position(self) -> Tuple[int, int]:
         """Calculate centered popup position."""
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._screen_size
         start_y = max(1, int((h - POPUP_HEIGHT) / 2))
         start_x = max(1, int((w - POPUP_WIDTH) / 2))
         return start_y, start_x
 
     def create_popup_window(self) -> curses.window:
         """Create and configure a popup window."""
+        self._screen_size = self.stdscr.getmaxyx()
         self.popup_start_y, self.popup_start_x = self.get_popup_position()
 
         # Draw shadow effect
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._screen_size
         ui_utils.CursesUIHelper.draw_shadow(
             self.stdscr, self.popup_start_y, self.popup_start_x, POPUP_WIDTH, POPUP_HEIGHT, h, w
         )
 
         popup_win = curses.newwin(POPUP_HEIGHT, POPUP_WIDTH, self.popup_start_y, self.popup_start_x)
         popup_win.keypad(True)
+        # The cursor is hidden, so curses need not move it back after each update
+        popup_win.leaveok(True)
         popup_win.bkgd(" ", curses.color_pair(THEME.REGULAR_ROW))
         return popup_win
 
+    def _popup_window(self) -> curses.window:
+        """Return the wizard's popup window, creating it for the first step."""
+        if self._popup is None:
+            self._popup = self.create_popup_window()
+        return self._popup
+
     def refresh_popup_shadow(self) -> None:
-        """Redraw the shadow after refreshing the popup window."""
-        h, w = self.stdscr.getmaxyx()
+        """Redraw the shadow and stage the screen for the next ``_flush``."""
+        h, w = self._screen_size
         ui_utils.CursesUIHelper.draw_shadow(
             self.stdscr, self.popup_start_y, self.popup_start_x, POPUP_WIDTH, POPUP_HEIGHT, h, w
         )
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
 
-    def show_introduction(self) -> bool:
-        """Show introduction screen with calibration instructions."""
-        popup_win = self.create_popup_window()
+    def _flush(self, popup_win: curses.window) -> None:
+        """Stage the popup over the screen and write both to the terminal in one update."""
+        popup_win.noutrefresh()
+        curses.doupdate()
 
+    def _reposition_popup(self, popup_win: curses.window) -> None:
+        """Re-centre the popup after a terminal resize and clear the old shadow."""
+        self.stdscr.erase()
+        self._screen_size = self.stdscr.getmaxyx()
+        self.popup_start_y, self.popup_start_x = self.get_popup_position()
         try:
-            while True:
-                popup_win.erase()
-                popup_win.box()
-
-                # Title
-                title = LABELS.WIZARD_TITLE.format(self.formatted_servo_name)
-                title_x = (POPUP_WIDTH - len(title)) // 2
-                popup_win.addstr(1, title_x, title, curses.A_BOLD)
-
-                # Separator
-                popup_win.hline(2, 1, curses.ACS_HLINE, POPUP_WIDTH - 2)
-
-                # Instructions
-                instructions = [
-                    LABELS.WIZARD_JOINT_TYPE_LINE.format(self.joint_type.value.upper()),
-                    "",
-                    LABELS.WIZARD_INSTRUCTION_1,
-                    LABELS.WIZARD_INSTRUCTION_2,
-                    LABELS.WIZARD_INSTRUCTION_3,
-                    "",
-                    LABELS.WIZARD_INSTRUCTION_4,
-                    LABELS.WIZARD_INSTRUCTION_5,
-                    "",
-                ]
-
-                for i, line in enumerate(instructions):
-                    popup_win.addstr(4 + i, 3, line)
-
-                popup_win.addstr(13, 3, LABELS.WIZARD_PRESS_ENTER_BEGIN, curses.A_DIM)
-                popup_win.addstr(14, 3, LABELS.WIZARD_PRESS_ESC_CANCEL, curses.A_DIM)
-
-                popup_win.refresh()
-                self.refresh_popup_shadow()
+            popup_win.mvwin(self.popup_start_y, self.popup_start_x)
+        except curses.error:
+            # Terminal smaller than the popup; keep the old position until it grows again
+            pass
+
+    @staticmethod
+    def _paint_popup(popup_win: curses.window, title: str, lines: list[tuple[int, str, int]]) -> None:
+        """Draw a popup frame with a centred title and pre-formatted ``(row, text, attr)`` lines."""
+        popup_win.erase()
+        popup_win.box()
+
+        # Title
+        title_x = (POPUP_WIDTH - len(title)) // 2
+        popup_win.addstr(1, title_x, title, curses.A_BOLD)
+
+        # Separator
+        popup_win.hline(2, 1, curses.ACS_HLINE, POPUP_WIDTH - 2)
+
+        # Bounded to the popup's inner width so a long line cannot wrap over the border
+        for row, text, attr in lines:
+            popup_win.addnstr(row, 3, text, _POPUP_TEXT_WIDTH, attr)
+
+    def _introduction_lines(self) -> list[tuple[int, str, int]]:
+        """Lines of the introduction popup."""
+        instructions = [
+            LABELS.WIZARD_JOINT_TYPE_LINE.format(self.joint_type.value.upper()),
+            "",
+            LABELS.WIZARD_INSTRUCTION_1,
+            LABELS.WIZARD_INSTRUCTION_2,
+            LABELS.WIZARD_INSTRUCTION_3,
+            "",
+            LABELS.WIZARD_INSTRUCTION_4,
+            LABELS.WIZARD_INSTRUCTION_5,
+            "",
+        ]
+        lines = [(4 + i, line, curses.A_NORMAL) for i, line in enumerate(instructions)]
+        lines.append((13, LABELS.WIZARD_PRESS_ENTER_BEGIN, curses.A_DIM))
+        lines.append((14, LABELS.WIZARD_PRESS_ESC_CANCEL, curses.A_DIM))
+        return lines
 
-                key = popup_win.getch()
-                if key in (curses.KEY_ENTER, 10, 13):
-                    return True
-                elif key == 27:  # ESC
-                    return False
+    def show_introduction(self) -> bool:
+        """Show introduction screen with calibration instructions."""
+        popup_win = self._popup_window()
+        title = LABELS.WIZARD_TITLE.format(self.formatted_servo_name)
+        lines = self._introduction_lines()
+
+        # Repaint only when something changed, not on every key
+        dirty = True
+        while True:
+            if dirty:
+                self._paint_popup(popup_win, title, lines)
+                self.refresh_popup_shadow()
+                self._flush(popup_win)
+                dirty = False
 
-        finally:
-            curses.endwin()
+            key = popup_win.getch()
+            if key in (curses.KEY_ENTER, 10, 13):
+                return True
+            elif key == 27:  # ESC
+                return False
+            elif key == curses.KEY_RESIZE:
+                self._reposition_popup(popup_win)
+                dirty = True
+
+    def _capture_point_lines(self, point: CalibrationPoint) -> list[tuple[int, str, int]]:
+        """Lines of the capture popup that stay fixed while the pulse is adjusted."""
+        # Display Point 1: show only if point 1 has been captured
+        if len(self.captured_points) > 0:
+            point1_str = LABELS.CALIBRATION_POINT_DISPLAY_FORMAT.format(
+                f"{self.captured_points[0].pulse_width:.2f}", self.captured_points[0].physical_angle
+            )
+        else:
+            point1_str = LABELS.WIZARD_DASH
+
+        # Display Point 2: show only if point 2 has been captured
+        if len(self.captured_points) > 1:
+            point2_str = LABELS.CALIBRATION_POINT_DISPLAY_FORMAT.format(
+                f"{self.captured_points[1].pulse_width:.2f}", self.captured_points[1].physical_angle
+            )
+        else:
+            point2_str = LABELS.WIZARD_DASH
+
+        return [
+            # Description
+            (4, point.description, curses.A_NORMAL),
+            (5, LABELS.WIZARD_EXPECTED_ANGLE.format(point.physical_angle), curses.A_NORMAL),
+            (8, f"{LABELS.CALIBRATION_POINT_LABEL_PREFIX.format(1)}{point1_str}", curses.A_NORMAL),
+            (9, f"{LABELS.CALIBRATION_POINT_LABEL_PREFIX.format(2)}{point2_str}", curses.A_NORMAL),
+            # Instructions
+            (11, LABELS.WIZARD_ADJUST_INSTRUCTION.format(CALIBRATION_STEP_SIZE), curses.A_DIM),
+            (12, LABELS.WIZARD_ENTER_CONFIRM_ESC_CANCEL, curses.A_DIM),
+        ]
+
+    @staticmethod
+    def _paint_current_pulse(popup_win: curses.window, pulse: float) -> None:
+        """Draw the current pulse line, padded so a shorter value clears the previous one."""
+        line = LABELS.WIZARD_CURRENT_PULSE.format(f"{pulse:.2f}")
+        popup_win.addnstr(7, 3, line.ljust(_POPUP_TEXT_WIDTH), _POPUP_TEXT_WIDTH)
 
     def capture_calibration_point(self, point_index: int, point: CalibrationPoint) -> bool:
         """Guide user to capture a single calibration point."""
-        popup_win = self.create_popup_window()
-        # Start at the midpoint between min and max pulse
-
-        try:
-            while True:
-                popup_win.erase()
-                popup_win.box()
-
-                # Title
-                title = LABELS.WIZARD_POINT_TITLE.format(point_index + 1, len(self.points))
-                title_x = (POPUP_WIDTH - len(title)) // 2
-                popup_win.addstr(1, title_x, title, curses.A_BOLD)
-
-                popup_win.hline(2, 1, curses.ACS_HLINE, POPUP_WIDTH - 2)
-
-                # Description
-                popup_win.addstr(4, 3, point.description)
-                popup_win.addstr(5, 3, LABELS.WIZARD_EXPECTED_ANGLE.format(point.physical_angle))
-
-                # Current values
-                popup_win.addstr(7, 3, LABELS.WIZARD_CURRENT_PULSE.format(f"{self.servo.pulse:.2f}"))
-
-                # Display Point 1: show only if point 1 has been captured
-                if len(self.captured_points) > 0:
-                    point1_str = LABELS.CALIBRATION_POINT_DISPLAY_FORMAT.format(
-                        f"{self.captured_points[0].pulse_width:.2f}", self.captured_points[0].physical_angle
-                    )
-                else:
-                    point1_str = LABELS.WIZARD_DASH
-                popup_win.addstr(8, 3, f"{LABELS.CALIBRATION_POINT_LABEL_PREFIX.format(1)}{point1_str}")
-
-                # Display Point 2: show only if point 2 has been captured
-                if len(self.captured_points) > 1:
-                    point2_str = LABELS.CALIBRATION_POINT_DISPLAY_FORMAT.format(
-                        f"{self.captured_points[1].pulse_width:.2f}", self.captured_points[1].physical_angle
-                    )
-                else:
-                    point2_str = LABELS.WIZARD_DASH
-                popup_win.addstr(9, 3, f"{LABELS.CALIBRATION_POINT_LABEL_PREFIX.format(2)}{point2_str}")
-
-                # Instructions
-                popup_win.addstr(
-                    11,
-                    3,
-                    LABELS.WIZARD_ADJUST_INSTRUCTION.format(CALIBRATION_STEP_SIZE),
-                    curses.A_DIM,
-                )
-                popup_win.addstr(12, 3, LABELS.WIZARD_ENTER_CONFIRM_ESC_CANCEL, curses.A_DIM)
-
-                popup_win.refresh()
+        popup_win = self._popup_window()
+        # Everything except the current pulse is fixed for the duration of this capture
+        title = LABELS.WIZARD_POINT_TITLE.format(point_index + 1, len(self.points))
+        lines = self._capture_point_lines(point)
+        # Last pulse written to the servo. Tracked here so the servo is only written when the
+        # value changes and never read back over I2C.
+        pulse = self.servo.pulse
+
+        # Full repaint on the first pass and after a resize; a pulse change only
+        # rewrites the current pulse line
+        dirty = True
+        pulse_dirty = False
+        while True:
+            if dirty:
+                self._paint_popup(popup_win, title, lines)
+                self._paint_current_pulse(popup_win, pulse)
                 self.refresh_popup_shadow()
-
-                key = popup_win.getch()
-
-                if key == curses.KEY_UP:
-                    new_pulse = max(
-                        SERVO_PULSE_WIDTH_MIN, min(SERVO_PULSE_WIDTH_MAX, self.servo.pulse + CALIBRATION_STEP_SIZE)
-                    )
-                    self.servo.set_pulse_unsafe(new_pulse)
-                elif key == curses.KEY_DOWN:
-                    new_pulse = max(
-                        SERVO_PULSE_WIDTH_MIN, min(SERVO_PULSE_WIDTH_MAX, self.servo.pulse - CALIBRATION_STEP_SIZE)
-                    )
-                    self.servo.set_pulse_unsafe(new_pulse)
-                elif key in (curses.KEY_ENTER, 10, 13):
-                    # Capture this point
-                    point.pulse_width = self.servo.pulse
-                    self.captured_points.append(point)
-                    return True
-                elif key == 27:  # ESC
-                    return False
-
-        finally:
-            curses.endwin()
+                self._flush(popup_win)
+                dirty = pulse_dirty = False
+            elif pulse_dirty:
+                self._paint_current_pulse(popup_win, pulse)
+                self._flush(popup_win)
+                pulse_dirty = False
+
+            key = popup_win.getch()
+
+            # Handle every key already queued, such as auto-repeat from a held arrow,
+            # before painting or writing, so a burst of keys costs one servo write and
+            # one repaint instead of one of each per key
+            target = pulse
+            popup_win.nodelay(True)
+            try:
+                while key != -1:
+                    if key == curses.KEY_UP or key == curses.KEY_DOWN:
+                        step = CALIBRATION_STEP_SIZE if key == curses.KEY_UP else -CALIBRATION_STEP_SIZE
+                        target += step
+                        # Keep the pulse inside the range any servo accepts
+                        if target < SERVO_PULSE_WIDTH_MIN:
+                            target = SERVO_PULSE_WIDTH_MIN
+                        elif target > SERVO_PULSE_WIDTH_MAX:
+                            target = SERVO_PULSE_WIDTH_MAX
+                    elif key in (curses.KEY_ENTER, 10, 13):
+                        # Capture this point, with the servo at the pulse being captured
+                        if target != pulse:
+                            self.servo.set_pulse_unsafe(target)
+                        self.captured_points.append(replace(point, pulse_width=target))
+                        return True
+                    elif key == 27:  # ESC
+                        return False
+                    elif key == curses.KEY_RESIZE:
+                        self._reposition_popup(popup_win)
+                        dirty = True
+                    key = popup_win.getch()
+            finally:
+                popup_win.nodelay(False)
+
+            # Holding a key at either limit produces no change, so nothing is sent
+            if target != pulse:
+                self.servo.set_pulse_unsafe(target)
+                pulse = target
+                pulse_dirty = True
+
+    def _confirmation_lines(self) -> list[tuple[int, str, int]]:
+        """Lines of the summary popup with the captured points and inferred pulse range."""
+        normal = curses.A_NORMAL
+
+        # Show captured values
+        lines = [
+            (4 + i, LABELS.WIZARD_POINT_SUMMARY.format(i + 1, f"{point.pulse_width:.2f}", point.physical_angle), normal)
+            for i, point in enumerate(self.captured_points)
+        ]
+        row = 4 + len(lines)
+
+        # The same values calculate_and_save_parameters() will save
+        inferred_min, inferred_max = self._inferred_pulse_range()
+
+        # A blank row separates each group
+        lines += [
+            (row + 1, LABELS.WIZARD_INFERRED_MIN_PULSE.format(self.servo.min_angle, f"{inferred_min:.2f}"), normal),
+            (row + 2, LABELS.WIZARD_INFERRED_MAX_PULSE.format(self.servo.max_angle, f"{inferred_max:.2f}"), normal),
+            (row + 4, LABELS.WIZARD_TARGET_RANGE.format(self.servo.min_angle, self.servo.max_angle), normal),
+            (row + 5, LABELS.WIZARD_REST_ANGLE.format(self.servo.rest_angle), normal),
+            (13, LABELS.WIZARD_ENTER_SAVE_ESC_CANCEL, curses.A_DIM),
+        ]
+        return lines
 
     def show_confirmation(self) -> bool:
         """Show confirmation screen with calculated values."""
         if len(self.captured_points) != len(self.points):
             return False
 
-        popup_win = self.create_popup_window()
+        popup_win = self._popup_window()
+        lines = self._confirmation_lines()
 
-        try:
-            while True:
-                popup_win.erase()
-                popup_win.box()
-
-                title = LABELS.WIZARD_SUMMARY_TITLE
-                title_x = (POPUP_WIDTH - len(title)) // 2
-                popup_win.addstr(1, title_x, title, curses.A_BOLD)
-
-                popup_win.hline(2, 1, curses.ACS_HLINE, POPUP_WIDTH - 2)
-
-                # Show captured values
-                row = 4
-                for i, point in enumerate(self.captured_points):
-                    popup_win.addstr(
-                        row,
-                        3,
-                        LABELS.WIZARD_POINT_SUMMARY.format(i + 1, f"{point.pulse_width:.2f}", point.physical_angle),
-                    )
-                    row += 1
-
-                # Calculate inferred min/max pulses
-                point1 = self.captured_points[0]
-                point2 = self.captured_points[1]
-                assert point1.pulse_width is not None
-                assert point2.pulse_width is not None
-                pulse1 = point1.pulse_width
-                pulse2 = point2.pulse_width
-                angle_diff = point2.physical_angle - point1.physical_angle
-                pulse_diff = pulse2 - pulse1
-                pulse_per_degree = pulse_diff / angle_diff if angle_diff != 0 else 0
-                inferred_min = pulse1 + (self.servo.min_angle - point1.physical_angle) * pulse_per_degree
-                inferred_max = pulse1 + (self.servo.max_angle - point1.physical_angle) * pulse_per_degree
-
-                popup_win.addstr(row, 3, "")
-                row += 1
-                popup_win.addstr(
-                    row,
-                    3,
-                    LABELS.WIZARD_INFERRED_MIN_PULSE.format(self.servo.min_angle, f"{inferred_min:.2f}"),
-                )
-                row += 1
-                popup_win.addstr(
-                    row,
-                    3,
-                    LABELS.WIZARD_INFERRED_MAX_PULSE.format(self.servo.max_angle, f"{inferred_max:.2f}"),
-                )
-                row += 1
-
-                popup_win.addstr(row, 3, "")
-                row += 1
-                popup_win.addstr(
-                    row,
-                    3,
-                    LABELS.WIZARD_TARGET_RANGE.format(self.servo.min_angle, self.servo.max_angle),
-                )
-                row += 1
-                popup_win.addstr(row, 3, LABELS.WIZARD_REST_ANGLE.format(self.servo.rest_angle))
-
-                popup_win.addstr(13, 3, LABELS.WIZARD_ENTER_SAVE_ESC_CANCEL, curses.A_DIM)
-
-                popup_win.refresh()
+        # The summary is static, so it is only repainted after a resize
+        dirty = True
+        while True:
+            if dirty:
+                self._paint_popup(popup_win, LABELS.WIZARD_SUMMARY_TITLE, lines)
                 self.refresh_popup_shadow()
+                self._flush(popup_win)
+                dirty = False
 
-                key = popup_win.getch()
-                if key in (curses.KEY_ENTER, 10, 13):
-                    return True
-                elif key == 27:  # ESC
-                    return False
+            key = popup_win.getch()
+            if key in (curses.KEY_ENTER, 10, 13):
+                return True
+            elif key == 27:  # ESC
+                return False
+            elif key == curses.KEY_RESIZE:
+                self._reposition_popup(popup_win)
+                dirty = True
 
-        finally:
-            curses.endwin()
+    def _inferred_pulse_range(self) -> Tuple[float, float]:
+        """Infer the min/max pulses of the servo's target range from the two captured points.
 
-    def calculate_and_save_parameters(self) -> None:
-        """Calculate servo parameters from captured points and save.
+        Shared by the confirmation preview and ``calculate_and_save_parameters`` so the
+        values shown are exactly the values saved.
 
-        For shoulder and leg servos, this uses two reference points to calibrate
-        through linear extrapolation. The captured pulse widths at the two reference
-        angles are used to infer min/max pulses for the target range.
+        Returns:
+            ``(min_pulse, max_pulse)``, clamped to the valid servo pulse range.
         """
         if len(self.captured_points) < 2:
             raise ValueError(LABELS.WIZARD_NEED_TWO_POINTS)
@@ -321,9 +364,22 @@ class CalibrationWizard:
 
         # Clamp min and max pulses to valid servo range
         min_pulse = max(SERVO_PULSE_WIDTH_MIN, min(SERVO_PULSE_WIDTH_MAX, min_pulse))
-        max_pulse = max(
-            SERVO_PULSE_WIDTH_MIN, min(SERVO_PULSE_WIDTH_MAX, max_pulse)
-        )  # Calculate target range (physical angle span)
+        max_pulse = max(SERVO_PULSE_WIDTH_MIN, min(SERVO_PULSE_WIDTH_MAX, max_pulse))
+        return min_pulse, max_pulse
+
+    def calculate_and_save_parameters(self, defer_save: bool = False) -> None:
+        """Calculate servo parameters from captured points and save.
+
+        For shoulder and leg servos, this uses two reference points to calibrate
+        through linear extrapolation. The captured pulse widths at the two reference
+        angles are used to infer min/max pulses for the target range.
+
+        Args:
+            defer_save: Update the configuration in memory only; the caller saves it.
+        """
+        min_pulse, max_pulse = self._inferred_pulse_range()
+
+        # Calculate target range (physical angle span)
         target_range = self.servo.max_angle - self.servo.min_angle
 
         # 🔧 Recalibrate the servo instance in memory
@@ -332,10 +388,15 @@ class CalibrationWizard:
         # Save to configuration
         self.config_provider.set_servo_min_pulse(self.servo_enum, min_pulse)
         self.config_provider.set_servo_max_pulse(self.servo_enum, max_pulse)
-        self.config_provider.save_config()
+        if not defer_save:
+            self.config_provider.save_config()
+
+    def run(self, defer_save: bool = False) -> bool:
+        """Run the complete calibration wizard.
 
-    def run(self) -> bool:
-        """Run the complete calibration wizard."""
+        Args:
+            defer_save: Passed to ``calculate_and_save_parameters``.
+        """
         try:
             if not self.show_introduction():
                 return False
@@ -347,7 +408,7 @@ class CalibrationWizard:
             if not self.show_confirmation():
                 return False
 
-            self.calculate_and_save_parameters()
+            self.calculate_and_save_parameters(defer_save)
             return True
 
         except Exception as e:
@@ -355,19 +416,35 @@ class CalibrationWizard:
             return False
 
 
+def _exit_on_signal(_signum, _frame) -> None:
+    """Turn a hangup or termination into SystemExit so pending finally blocks run."""
+    sys.exit(1)
+
+
 def _calibrate_all_servos() -> None:
     """Calibrate all servos sequentially."""
     servo_ids = [s.value for s in ServoName]
     successful = []
     failed = []
 
-    for sid in servo_ids:
-        try:
-            _calibrate_single_servo(sid)
-            successful.append(sid)
-        except Exception as e:
-            print(LABELS.WIZARD_ERROR_CALIBRATING.format(sid, e))
-            failed.append(sid)
+    # Servos update the shared configuration in memory; it is written once when the
+    # batch ends, including when it is interrupted, so completed servos are kept.
+    # A dropped SSH session ends the batch with SIGHUP or SIGTERM, which would otherwise
+    # skip the finally block, so both are raised as SystemExit while the batch runs.
+    previous_handlers = {signum: signal.signal(signum, _exit_on_signal) for signum in (signal.SIGHUP, signal.SIGTERM)}
+    try:
+        for sid in servo_ids:
+            try:
+                _calibrate_single_servo(sid, defer_save=True)
+                successful.append(sid)
+            except Exception as e:
+                print(LABELS.WIZARD_ERROR_CALIBRATING.format(sid, e))
+                failed.append(sid)
+    finally:
+        if successful:
+            ConfigProvider().save_config()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
 
     print(LABELS.WIZARD_SEPARATOR)
     print(LABELS.WIZARD_SUCCESS_COUNT.format(len(successful)))
@@ -403,22 +480,22 @@ def main(servo_id: str) -> None:
         sys.exit(1)
 
 
-def _calibrate_single_servo(servo_id: str) -> None:
+def _calibrate_single_servo(servo_id: str, defer_save: bool = False) -> None:
     """Calibrate a single servo.
 
     Args:
         servo_id: The servo ID to calibrate
+        defer_save: Leave saving the configuration to the caller
 
     Raises:
         ValueError: If servo_id is invalid
     """
     # Validate servo ID
-    try:
-        servo_enum = ServoName(servo_id)
-    except ValueError:
+    servo_enum = _SERVO_NAMES_BY_ID.get(servo_id)
+    if servo_enum is None:
         print(LABELS.WIZARD_INVALID_SERVO_ID.format(servo_id))
-        print(LABELS.WIZARD_VALID_SERVO_IDS.format(', '.join([s.value for s in ServoName])))
-        raise
+        print(_VALID_SERVO_IDS_MSG)
+        raise ValueError(f"{servo_id!r} is not a valid {ServoName.__name__}")
 
     # Create the servo object and config provider
     servo = ServoFactory.create(servo_enum)
@@ -427,6 +504,7 @@ def _calibrate_single_servo(servo_id: str) -> None:
     # Run wizard
     def wizard_wrapper(stdscr):
         curses.curs_set(0)
+        stdscr.leaveok(True)
         curses.start_color()
         curses.use_default_colors()
         ui_utils.CursesUIHelper.init_colors(THEME.DEFAULT_THEME)
@@ -434,7 +512,7 @@ def _calibrate_single_servo(servo_id: str) -> None:
         stdscr.refresh()
 
         wizard = CalibrationWizard(stdscr, servo, config_provider, servo_enum)
-        return wizard.run()
+        return wizard.run(defer_save)
 
     result = curses.wrapper(wizard_wrapper)
 
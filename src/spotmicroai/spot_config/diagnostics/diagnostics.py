@@ -26,6 +26,7 @@ from spotmicroai.constants import (
 from spotmicroai.hardware.servo import JointType
 from spotmicroai.hardware.servo._servo import Servo
 from spotmicroai.hardware.servo._servo_factory import ServoFactory
+from spotmicroai.hardware.servo.pca9685 import PCA9685
 from spotmicroai.runtime.abort_controller.abort_controller import AbortController
 from spotmicroai.spot_config.ui import theme as THEME, ui_utils
 import spotmicroai.labels as LABELS
@@ -46,6 +47,8 @@ class DiagnosticsWizard:
         self.servo_groups: Dict[JointType, List[ServoName]] = {}
         self.popup_start_y = 0
         self.popup_start_x = 0
+        # Terminal (height, width), refreshed when a popup is created and on KEY_RESIZE
+        self._screen_size = stdscr.getmaxyx()
 
     def _load_all_servos(self) -> None:
         """Load all 12 servos and group by joint type."""
@@ -64,16 +67,17 @@ class DiagnosticsWizard:
 
     def get_popup_position(self) -> Tuple[int, int]:
         """Calculate centered popup position."""
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._screen_size
         start_y = max(1, (h - POPUP_HEIGHT) // 2)
         start_x = max(1, (w - POPUP_WIDTH) // 2)
         return start_y, start_x
 
     def create_popup_window(self) -> curses.window:
         """Create and configure a popup window."""
+        self._screen_size = self.stdscr.getmaxyx()
         self.popup_start_y, self.popup_start_x = self.get_popup_position()
 
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._screen_size
         ui_utils.CursesUIHelper.draw_shadow(
             self.stdscr, self.popup_start_y, self.popup_start_x, POPUP_WIDTH, POPUP_HEIGHT, h, w
         )
@@ -84,12 +88,28 @@ class DiagnosticsWizard:
         return popup_win
 
     def refresh_popup_shadow(self) -> None:
-        """Redraw the shadow after refreshing the popup window."""
-        h, w = self.stdscr.getmaxyx()
+        """Redraw the shadow and stage the screen for the next ``_flush``."""
+        h, w = self._screen_size
         ui_utils.CursesUIHelper.draw_shadow(
             self.stdscr, self.popup_start_y, self.popup_start_x, POPUP_WIDTH, POPUP_HEIGHT, h, w
         )
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+
+    def _flush(self, popup_win: curses.window) -> None:
+        """Stage the popup over the screen and write both to the terminal in one update."""
+        popup_win.noutrefresh()
+        curses.doupdate()
+
+    def _reposition_popup(self, popup_win: curses.window) -> None:
+        """Re-centre the popup after a terminal resize and clear the old shadow."""
+        self.stdscr.erase()
+        self._screen_size = self.stdscr.getmaxyx()
+        self.popup_start_y, self.popup_start_x = self.get_popup_position()
+        try:
+            popup_win.mvwin(self.popup_start_y, self.popup_start_x)
+        except curses.error:
+            # Terminal smaller than the popup; keep the old position until it grows again
+            pass
 
     def show_introduction(self) -> bool:
         """Show introduction screen with diagnostics instructions."""
@@ -130,14 +150,16 @@ class DiagnosticsWizard:
                 self._safe_addstr(popup_win, 13, 2, LABELS.DIAG_ENTER_BEGIN, curses.A_DIM)
                 self._safe_addstr(popup_win, 14, 2, LABELS.DIAG_PRESS_ESC_CANCEL, curses.A_DIM)
 
-                popup_win.refresh()
                 self.refresh_popup_shadow()
+                self._flush(popup_win)
 
                 key = popup_win.getch()
                 if key in (curses.KEY_ENTER, 10, 13):
                     return True
                 elif key == 27:  # ESC
                     return False
+                elif key == curses.KEY_RESIZE:
+                    self._reposition_popup(popup_win)
 
         finally:
             curses.endwin()
@@ -220,8 +242,8 @@ class DiagnosticsWizard:
                 self._safe_addstr(popup_win, 13, 2, LABELS.DIAG_PRESS_ENTER_NEXT, curses.A_DIM)
                 self._safe_addstr(popup_win, 14, 2, LABELS.DIAG_PRESS_ESC_CANCEL, curses.A_DIM)
 
-                popup_win.refresh()
                 self.refresh_popup_shadow()
+                self._flush(popup_win)
 
                 # Check for user input (non-blocking)
                 popup_win.nodelay(True)
@@ -230,6 +252,8 @@ class DiagnosticsWizard:
 
                 if key == 27:  # ESC - cancel
                     return False
+                elif key == curses.KEY_RESIZE:
+                    self._reposition_popup(popup_win)
 
                 # Calculate next angle based on sweep rate and time
                 elapsed = time.time() - start_time
@@ -270,6 +294,11 @@ class DiagnosticsWizard:
                             return True
                         elif key == 27:
                             return False
+                        elif key == curses.KEY_RESIZE:
+                            # The loop above no longer repaints, so redraw the final frame here
+                            self._reposition_popup(popup_win)
+                            self.refresh_popup_shadow()
+                            self._flush(popup_win)
 
                 time.sleep(FRAME_DURATION)
 
@@ -346,12 +375,14 @@ class DiagnosticsWizard:
 
                 self._safe_addstr(popup_win, 13, 2, LABELS.DIAG_PRESS_ENTER_FINISH, curses.A_DIM)
 
-                popup_win.refresh()
                 self.refresh_popup_shadow()
+                self._flush(popup_win)
 
                 key = popup_win.getch()
                 if key in (curses.KEY_ENTER, 10, 13):
                     return
+                elif key == curses.KEY_RESIZE:
+                    self._reposition_popup(popup_win)
 
         finally:
             curses.endwin()
@@ -388,6 +419,9 @@ def main() -> None:
 
     try:
         abort_controller.activate_servos()
+        # Bring the PWM board up while curses initializes; servo creation waits for it
+        PCA9685().activate_async()
+
         def diagnostics_wrapper(stdscr):
             curses.curs_set(0)
             curses.start_color()
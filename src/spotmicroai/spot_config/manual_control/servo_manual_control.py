@@ -25,6 +25,9 @@ class ServoManualControl:
         self.servo = servo
         self.servo_enum = servo_enum
         self.formatted_servo_name = servo_enum.value.replace("_", " ").title()
+        # The title only depends on the servo, so it is built once rather than on every redraw
+        self._title = LABELS.MANUAL_TITLE.format(self.formatted_servo_name)
+        self._title_x = (POPUP_WIDTH - len(self._title)) // 2
 
     def get_popup_position(self):
         """Center the popup on screen."""
@@ -41,58 +44,97 @@ class ServoManualControl:
         win.bkgd(" ", curses.color_pair(THEME.REGULAR_ROW))
         return win
 
+    def _draw_chrome(self, popup) -> None:
+        """Draw the parts of the popup that do not change while the pulse is adjusted."""
+        popup.erase()
+        popup.box()
+
+        # Title
+        popup.addstr(1, self._title_x, self._title, curses.A_BOLD)
+        popup.hline(2, 1, curses.ACS_HLINE, POPUP_WIDTH - 2)
+
+        # Calculate angles for display
+        min_angle = round(self.servo.min_angle, 1)
+        max_angle = round(self.servo.max_angle, 1)
+
+        # Info
+        popup.addstr(4, 3, LABELS.MANUAL_CURRENT_PULSE_WIDTH, curses.A_BOLD)
+
+        popup.addstr(7, 3, LABELS.MANUAL_SERVO_RANGE)
+        popup.addstr(
+            8,
+            3,
+            f"  Min: {self.servo.min_pulse} µs ({min_angle}°) | "
+            f"Max: {self.servo.max_pulse} µs ({max_angle}°)",
+        )
+
+        popup.addstr(10, 3, LABELS.MANUAL_REST_ANGLE)
+        popup.addstr(11, 3, f"  {int(self.servo.rest_angle)}°")
+
+        popup.addstr(
+            13,
+            3,
+            LABELS.MANUAL_ADJUST_INSTRUCTION.format(CALIBRATION_STEP_SIZE),
+            curses.A_DIM,
+        )
+        popup.addstr(14, 3, LABELS.MANUAL_EXIT_INSTRUCTION, curses.A_DIM)
+
+    def _draw_current_pulse(self, popup, pulse: float) -> None:
+        """Draw the current pulse line, padded so a shorter value clears the previous one."""
+        current_angle = round(self.servo.angle, 1)
+        line = f"  {pulse} µs  ({current_angle}°)"
+        popup.addnstr(5, 3, line.ljust(POPUP_WIDTH - 4), POPUP_WIDTH - 4)
+
     def run(self) -> bool:
         """Run manual control UI loop."""
         popup = self.create_popup_window()
+        # Last pulse written to the servo, kept inside the calibrated range the Servo
+        # setter clamps to, so a key press at either limit does not repeat the same write
+        pulse = self.servo.pulse
+        min_pulse = min(self.servo.min_pulse, self.servo.max_pulse)
+        max_pulse = max(self.servo.min_pulse, self.servo.max_pulse)
         try:
+            # The rest of the popup is drawn once, and again only after a resize;
+            # each key then rewrites just the current pulse line
+            redraw = True
             while True:
-                popup.erase()
-                popup.box()
-
-                # Title
-                title = LABELS.MANUAL_TITLE.format(self.formatted_servo_name)
-                popup.addstr(1, (POPUP_WIDTH - len(title)) // 2, title, curses.A_BOLD)
-                popup.hline(2, 1, curses.ACS_HLINE, POPUP_WIDTH - 2)
-
-                # Calculate angles for display
-                current_angle = round(self.servo.angle, 1)
-                min_angle = round(self.servo.min_angle, 1)
-                max_angle = round(self.servo.max_angle, 1)
-
-                # Info
-                popup.addstr(4, 3, LABELS.MANUAL_CURRENT_PULSE_WIDTH, curses.A_BOLD)
-                popup.addstr(5, 3, f"  {self.servo.pulse} µs  ({current_angle}°)")
-
-                popup.addstr(7, 3, LABELS.MANUAL_SERVO_RANGE)
-                popup.addstr(
-                    8,
-                    3,
-                    f"  Min: {self.servo.min_pulse} µs ({min_angle}°) | "
-                    f"Max: {self.servo.max_pulse} µs ({max_angle}°)",
-                )
-
-                popup.addstr(10, 3, LABELS.MANUAL_REST_ANGLE)
-                popup.addstr(11, 3, f"  {int(self.servo.rest_angle)}°")
-
-                popup.addstr(
-                    13,
-                    3,
-                    LABELS.MANUAL_ADJUST_INSTRUCTION.format(CALIBRATION_STEP_SIZE),
-                    curses.A_DIM,
-                )
-                popup.addstr(14, 3, LABELS.MANUAL_EXIT_INSTRUCTION, curses.A_DIM)
-                popup.refresh()
-
-                # Key input
+                if redraw:
+                    self._draw_chrome(popup)
+                    redraw = False
+                self._draw_current_pulse(popup, pulse)
+                popup.noutrefresh()
+                curses.doupdate()
+
+                # Key input. Every key already queued, such as auto-repeat from a held
+                # arrow, is handled before the servo is written and the pulse redrawn.
                 key = popup.getch()
-                if key == curses.KEY_UP:
-                    step = CALIBRATION_STEP_SIZE if not self.servo.is_inverted else -CALIBRATION_STEP_SIZE
-                    self.servo.pulse = self.servo.pulse + step
-                elif key == curses.KEY_DOWN:
-                    step = -CALIBRATION_STEP_SIZE if not self.servo.is_inverted else CALIBRATION_STEP_SIZE
-                    self.servo.pulse = self.servo.pulse + step
-                elif key == 27:  # ESC
-                    return True
+                target = pulse
+                popup.nodelay(True)
+                try:
+                    while key != -1:
+                        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+                            step = CALIBRATION_STEP_SIZE if key == curses.KEY_UP else -CALIBRATION_STEP_SIZE
+                            if self.servo.is_inverted:
+                                step = -step
+                            target = max(min_pulse, min(max_pulse, target + step))
+                        elif key == 27:  # ESC
+                            return True
+                        elif key == curses.KEY_RESIZE:
+                            self.stdscr.erase()
+                            self.stdscr.noutrefresh()
+                            try:
+                                popup.mvwin(*self.get_popup_position())
+                            except curses.error:
+                                # Terminal smaller than the popup; keep the old position
+                                pass
+                            redraw = True
+                        key = popup.getch()
+                finally:
+                    popup.nodelay(False)
+
+                if target != pulse:
+                    self.servo.pulse = target
+                    pulse = target
 
         finally:
             curses.endwin()
@@ -30,18 +30,33 @@ Example JSON:
 }
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import json
+import os
 from pathlib import Path
+import pickle
 
 import curses
 from enum import Enum
 import subprocess
 import sys
+from types import MappingProxyType
 from typing import Any, Mapping
 
 import spotmicroai.labels as LABELS
 from spotmicroai.spot_config.ui import theme as THEME, ui_utils
 
+# orjson parses menu files noticeably faster when installed; stdlib json is the fallback
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
 
 class MenuAction(Enum):
     SUBMENU = "submenu"
@@ -95,7 +110,9 @@ class ConfigApp:
         if entry_menu not in menus:
             raise KeyError(f"Entry menu '{entry_menu}' not found in menu definitions.")
 
-        self.menus = dict(menus)
+        self.menus = menus
+        # Problems found in the menu options, checked once here rather than on every selection
+        self._option_errors = validate_menus(menus)
         self.menu_stack = [(entry_menu, context or {})]
         self.current_index = 0
         self.scroll_offset = 0  # Track scroll position for viewport
@@ -441,43 +458,47 @@ class ConfigApp:
     # Option Execution
     # -------------------------------------------------------------------------
     def _execute_option(self, option: dict) -> None:
-        """Execute an option based on its action type."""
-        action_str = option.get("action")
-        try:
-            action = MenuAction(action_str)
-        except ValueError:
-            self._error(LABELS.MSG_INVALID_ACTION.format(action_str))
+        """Execute an option based on its action type.
+
+        Options were checked by validate_menus() when the app was created, so a valid
+        option is dispatched straight to its handler and an invalid one shows its error.
+        """
+        error = self._option_errors.get((self._get_current_menu_name(), self.current_index))
+        if error is not None:
+            self._error(error)
             return
+        self._ACTION_HANDLERS[option["action"]](self, option)
+
+    def _open_submenu(self, option: dict) -> None:
+        """Push the submenu named by the option's target onto the menu stack."""
+        self.menu_stack.append((option["target"], option.get("params", {})))
+        self.current_index = 0
+        self.scroll_offset = 0
 
-        if action == MenuAction.SUBMENU:
-            target = option.get("target")
-            params = option.get("params", {})
-            if not isinstance(target, str):
-                self._error(LABELS.MSG_INVALID_SUBMENU_TARGET)
-                return
-            if target not in self.menus:
-                self._error(LABELS.MSG_SUBMENU_NOT_FOUND.format(target))
-                return
-            if not isinstance(params, dict):
-                self._error("Invalid parameters for submenu")
-                return
-            self.menu_stack.append((target, params))
+    def _go_back(self, option: dict) -> None:
+        """Return to the previous menu, if any."""
+        if len(self.menu_stack) > 1:
+            self.menu_stack.pop()
             self.current_index = 0
             self.scroll_offset = 0
 
-        elif action == MenuAction.BACK:
-            if len(self.menu_stack) > 1:
-                self.menu_stack.pop()
-                self.current_index = 0
-                self.scroll_offset = 0
-
-        elif action == MenuAction.EXIT:
-            sys.exit(0)
-
-        elif action == MenuAction.RUN:
-            command = option.get("command")
-            interpolated_command = self._interpolate(command)
-            self._run_command(interpolated_command)
+    def _exit(self, option: dict) -> None:
+        """Leave the application."""
+        sys.exit(0)
+
+    def _run_option_command(self, option: dict) -> None:
+        """Run the option's command after interpolating the current context."""
+        command = option["command"]
+        interpolated_command = self._interpolate(command)
+        self._run_command(interpolated_command)
+
+    # Handler for each MenuAction, keyed by the raw action string found in the menu JSON
+    _ACTION_HANDLERS = {
+        MenuAction.SUBMENU.value: _open_submenu,
+        MenuAction.BACK.value: _go_back,
+        MenuAction.EXIT.value: _exit,
+        MenuAction.RUN.value: _run_option_command,
+    }
 
     # -------------------------------------------------------------------------
     # Command Runner
@@ -541,33 +562,181 @@ class ConfigApp:
         stdscr.refresh()
 
 
-def load_menus(base_dir: Path) -> dict[str, dict]:
+# Directory holding the menu JSON definitions
+MENUS_DIR = Path(__file__).resolve().parent / "menus"
+# Directory, relative to the menu directory, holding the merged-menu pickle cache
+MENU_CACHE_DIR = ".cache"
+# Upper bound on threads used to read menu files concurrently
+MENU_READ_WORKERS = 8
+
+
+def _scan_menu_files(base_dir: Path) -> list[os.DirEntry]:
+    """List the menu JSON files in base_dir, sorted by name, in a single directory scan."""
+    with os.scandir(base_dir) as entries:
+        json_files = [entry for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+    json_files.sort(key=lambda entry: entry.name)
+    return json_files
+
+
+def _menu_cache_key(json_files: list[os.DirEntry]) -> str:
+    """Build a cache key from the name, size and modification time of every menu file."""
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in json_files:
+        stat = entry.stat()
+        digest.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()
+
+
+def _read_menu_file(entry: os.DirEntry) -> bytes:
+    """Read the raw contents of a menu file."""
+    with open(entry.path, "rb") as f:
+        return f.read()
+
+
+def _read_baked_menus(cache_key: str) -> dict[str, dict] | None:
+    """Return the menus baked by bake_menus.py if they were built from the current files."""
+    try:
+        from spotmicroai.spot_config import menus_baked  # type: ignore
+    except ImportError:
+        return None
+    if menus_baked.SOURCE_KEY != cache_key:
+        return None
+    return menus_baked.MENUS
+
+
+def _read_menu_cache(cache_file: Path) -> dict[str, dict] | None:
+    """Return the cached merged menus, or None if the cache is missing or unreadable."""
+    try:
+        with cache_file.open("rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def _write_menu_cache(cache_file: Path, menus: dict[str, dict]) -> None:
+    """Store the merged menus and drop caches built from older menu files."""
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        for stale in cache_file.parent.glob("*.pkl"):
+            stale.unlink()
+        with cache_file.open("wb") as f:
+            pickle.dump(menus, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # A read-only install simply runs without the cache
+        pass
+
+
+def _intern_menu_strings(value: Any) -> Any:
+    """Recursively intern dictionary keys and action names in parsed menu data."""
+    if isinstance(value, dict):
+        return {
+            sys.intern(key): (
+                sys.intern(item) if key == "action" and isinstance(item, str) else _intern_menu_strings(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_menu_strings(item) for item in value]
+    return value
+
+
+def _freeze_menus(menus: dict[str, dict]) -> Mapping[str, dict]:
+    """Intern menu strings and wrap the merged menus in a read-only mapping."""
+    return MappingProxyType(_intern_menu_strings(menus))
+
+
+def load_menus(base_dir: Path) -> Mapping[str, dict]:
     """
     Load and merge multiple menu JSON files into a single dictionary in memory.
 
+    Menus baked into ``menus_baked.py`` by ``bake_menus.py`` are used first. Otherwise
+    the merged result is pickled under ``MENU_CACHE_DIR``. Both are keyed by the menu
+    files' names, sizes and modification times, so JSON is only parsed after a menu
+    file changes.
+
     Args:
         base_dir (Path): Directory containing menu files.
 
     Returns:
-        dict: Combined menu structure.
+        Mapping: Combined menu structure, read-only.
     """
     combined: dict[str, dict] = {}
 
     if not base_dir.exists():
         raise FileNotFoundError(f"Menu directory not found: {base_dir}")
 
-    json_files = sorted(base_dir.glob("*.json"))
+    json_files = _scan_menu_files(base_dir)
     if not json_files:
         print(f"[WARN] No menu definitions found in {base_dir}")
+        return _freeze_menus(combined)
+
+    cache_key = _menu_cache_key(json_files)
+    baked = _read_baked_menus(cache_key)
+    if baked is not None:
+        return _freeze_menus(baked)
+
+    cache_file = base_dir / MENU_CACHE_DIR / f"{cache_key}.pkl"
+    cached = _read_menu_cache(cache_file)
+    if cached is not None:
+        return _freeze_menus(cached)
 
-    for file_path in json_files:
+    # Overlap file reads (slow on SD cards); parsing stays sequential to keep merge order
+    with ThreadPoolExecutor(max_workers=min(MENU_READ_WORKERS, len(json_files))) as executor:
+        contents = list(executor.map(_read_menu_file, json_files))
+
+    parse_failed = False
+    for entry, raw in zip(json_files, contents):
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
+            data = _json_loads(raw)
             combined.update(data)
-        except json.JSONDecodeError as e:
-            print(f"[ERROR] Failed to parse {file_path}: {e}")
+        except _JSON_DECODE_ERRORS as e:
+            parse_failed = True
+            print(f"[ERROR] Failed to parse {entry.path}: {e}")
+
+    # Only cache a clean load so parse errors keep being reported
+    if not parse_failed:
+        _write_menu_cache(cache_file, combined)
+
+    return _freeze_menus(combined)
+
+
+def _validate_option(option: Any, menus: Mapping[str, Any]) -> str | None:
+    """Return the problem with a single menu option, or None if it is valid."""
+    if not isinstance(option, dict):
+        return LABELS.MSG_INVALID_ACTION.format(option)
+    action = option.get("action")
+    if action not in ConfigApp._ACTION_HANDLERS:
+        return LABELS.MSG_INVALID_ACTION.format(action)
+    if action == MenuAction.SUBMENU.value:
+        target = option.get("target")
+        if not isinstance(target, str):
+            return LABELS.MSG_INVALID_SUBMENU_TARGET
+        if target not in menus:
+            return LABELS.MSG_SUBMENU_NOT_FOUND.format(target)
+        if not isinstance(option.get("params", {}), dict):
+            return LABELS.MSG_INVALID_SUBMENU_PARAMS
+    elif action == MenuAction.RUN.value and not isinstance(option.get("command"), str):
+        return LABELS.MSG_MISSING_COMMAND
+    return None
+
+
+def validate_menus(menus: Mapping[str, Any]) -> dict[tuple[str, int], str]:
+    """
+    Check every option of the loaded menus once.
 
-    return combined
+    Args:
+        menus (Mapping): Combined menu structure returned by load_menus().
+
+    Returns:
+        dict: Error message for each invalid option, keyed by (menu name, option index).
+    """
+    errors: dict[tuple[str, int], str] = {}
+    for menu_name, menu in menus.items():
+        for index, option in enumerate(menu.get("options", [])):
+            problem = _validate_option(option, menus)
+            if problem is not None:
+                errors[(menu_name, index)] = problem
+    return errors
 
 
 def main() -> None:
@@ -578,9 +747,7 @@ def main() -> None:
     2. Combine them in memory.
     3. Start the ConfigApp UI with entry_menu="main".
     """
-    base_dir = Path(__file__).resolve().parent / "menus"
-
-    menus = load_menus(base_dir)
+    menus = load_menus(MENUS_DIR)
     if "main" not in menus:
         raise KeyError("Missing 'main' menu in loaded definitions.")
 